@@ -1,14 +1,24 @@
 """
 My Plant Pal - A modern plant care tracker with a sleek UI, built using Tkinter.
+Plant data, due-date rules and storage live in plant_core.py; this is the Tk front end.
 |================================================================================|
 Author: Victor Delgado | GitHub: https://github.com/VictorDelgadoJ-Ops/My-Plant-Pal
 """
 
+import time
+STARTUP_STARTED = time.perf_counter()  # Reference point for --startup-time
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from PIL import Image, ImageTk
-import json, os
-from datetime import datetime, timedelta
+import json, os, hashlib, queue, sys, threading, weakref
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from plant_core import (
+    FORECAST_DAYS, Plant, PlantCollection, Sun, WateringLog,
+    open_storage, record_watering, write_json_atomic
+)
+from plant_trace import TRACE
 
 # ---------- THEMES ----------
 # Light theme color palette with bright, neutral colors
@@ -36,12 +46,829 @@ DARK_THEME = {
 # Global theme variable that can be switched at runtime
 THEME = DARK_THEME.copy()
 
+# ---------- THEME REGISTRY ----------
+# Widget options each role takes from THEME
+THEME_ROLES = {
+    "main": {"bg": "bg_main"},
+    "panel": {"bg": "bg_panel"},
+    "header": {"bg": "header_bg"},
+    "header_label": {"bg": "header_bg", "fg": "header_text"},
+    "label": {"bg": "bg_main", "fg": "text"},
+    "panel_label": {"bg": "bg_panel", "fg": "text"},
+    "button": {"bg": "btn", "fg": "btn_text", "activebackground": "btn_hover"},
+    "menu": {"bg": "btn", "fg": "btn_text", "activebackground": "btn_hover", "activeforeground": "btn_text"},
+    "entry": {"bg": "entry_bg", "fg": "entry_fg", "insertbackground": "entry_fg"},
+    "canvas": {"bg": "bg_panel", "highlightbackground": "input_border"},
+}
+
+class ThemeRegistry:
+    """Live widgets and the role that picks their colors from THEME.
+
+    Widgets are held through weak references, so destroyed windows and
+    rebuilt pages drop out on their own; a theme change is one configure
+    call per live widget and never rebuilds anything.
+    """
+
+    def __init__(self):
+        self._widgets = weakref.WeakKeyDictionary()  # widget -> role
+
+    def __len__(self):
+        return len(self._widgets)
+
+    def add(self, widget, role):
+        self._widgets[widget] = role
+        return widget
+
+    def restyle(self):
+        options = {role: {option: THEME[key] for option, key in keys.items()}
+                   for role, keys in THEME_ROLES.items()}
+        for widget, role in list(self._widgets.items()):
+            try:
+                widget.configure(**options[role])
+            except tk.TclError:
+                del self._widgets[widget]  # Destroyed but not yet collected
+
+# ---------- THUMBNAIL CACHE ----------
+# Upper bound on decoded thumbnail pixels kept in memory (RGBA, 4 bytes per pixel)
+THUMB_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+Image = None  # Pillow, imported by load_pil() the first time an image needs resizing
+
+def load_pil():
+    """Import Pillow on first use; once every derivative is on disk it is never needed"""
+    global Image
+    if Image is None:
+        from PIL import Image
+
+class ThumbnailCache:
+    """LRU cache of resized PhotoImages keyed by source path, mtime, file size and target size"""
+
+    def __init__(self, max_bytes=THUMB_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (photo, nbytes), oldest first
+        self._current = {}  # (path, size) -> newest key, so stale versions are dropped early
+
+    def key(self, path, size):
+        """Return the cache key for path at size, or None if the file is missing"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), size, st.st_mtime_ns, st.st_size)
+
+    def lookup(self, key):
+        """Return the cached PhotoImage for key, counting the hit or miss"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def add(self, key, png):
+        """Cache a PhotoImage of a PNG already at the right size (Tk thread only)"""
+        try:
+            photo = tk.PhotoImage(file=png)  # Tk reads PNG itself, no Pillow needed
+        except tk.TclError:
+            return None
+        width, height = photo.width(), photo.height()
+        stale = self._current.get(key[:2])
+        if stale is not None:
+            self._drop(stale)
+        self._current[key[:2]] = key
+        nbytes = width * height * 4
+        self._entries[key] = (photo, nbytes)
+        self.bytes += nbytes
+        self._evict()
+        return photo
+
+    def get(self, path, size, decoder):
+        """Return a PhotoImage of path at size, asking decoder for its PNG synchronously on a miss, or None"""
+        key = self.key(path, size)
+        if key is None:
+            return None
+        photo = self.lookup(key)
+        if photo is None:
+            png = decoder(path, size)
+            if png is not None:
+                photo = self.add(key, png)
+        return photo
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+            if self._current.get(key[:2]) == key:
+                del self._current[key[:2]]
+
+    def _evict(self):
+        # Widgets keep their own reference to displayed images, so evicting only
+        # releases the cache's hold; least recently used entries go first
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            self._drop(next(iter(self._entries)))
+
+    def stats(self):
+        """Return hit/miss counters and current memory use"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries), "bytes": self.bytes,
+            "max_bytes": self.max_bytes
+        }
+
+# Shared by icons, list thumbnails and the details view
+THUMB_CACHE = ThumbnailCache()
+
+# ---------- THUMBNAIL STORE ----------
+# Pre-generated derivatives live here so startup never decodes original photos
+THUMB_DIR = "thumbnails"
+THUMB_SIZES = ((40, 40), (200, 200))  # List row and details view
+
+class ThumbnailStore:
+    """Content-addressed directory of small PNG derivatives of plant images (thread-safe)"""
+
+    def __init__(self, directory=THUMB_DIR, sizes=THUMB_SIZES):
+        self.directory = directory
+        self.sizes = sizes
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self._manifest = {}  # absolute source path -> [mtime_ns, file size, sha1]
+        self._dirty = False
+        self._lock = threading.Lock()
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, "r") as f:
+                    self._manifest = json.load(f)
+            except (OSError, ValueError):
+                self._manifest = {}  # Corrupt manifest, everything gets rehashed
+
+    def thumb_path(self, digest, size):
+        return os.path.join(self.directory, f"{digest}_{size[0]}x{size[1]}.png")
+
+    def digest(self, path):
+        """Return the content hash of path, rehashing only when its mtime or size changed"""
+        st = os.stat(path)
+        source = os.path.abspath(path)
+        with self._lock:
+            entry = self._manifest.get(source)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        with self._lock:
+            self._manifest[source] = [st.st_mtime_ns, st.st_size, digest]
+            self._dirty = True
+        return digest
+
+    def generate(self, path, sizes=None):
+        """Write every derivative size of path that is missing, returning its digest"""
+        digest = self.digest(path)
+        missing = [size for size in sizes or self.sizes if not os.path.exists(self.thumb_path(digest, size))]
+        if missing:
+            load_pil()
+            TRACE.count("thumbs generated")
+            os.makedirs(self.directory, exist_ok=True)
+            with TRACE.span("thumb.generate"), Image.open(path) as img:
+                img = img.convert("RGBA")
+                for size in missing:
+                    target = self.thumb_path(digest, size)
+                    tmp = f"{target}.{threading.get_ident()}.tmp"
+                    img.resize(size, Image.LANCZOS).save(tmp, "PNG")
+                    os.replace(tmp, target)  # Never leave a half-written thumbnail behind
+        return digest
+
+    def ensure(self, path, size):
+        """Return the derivative path of path at size, generating it if needed, or None"""
+        try:
+            digest = self.digest(path)
+            target = self.thumb_path(digest, size)
+            if not os.path.exists(target):
+                # A list or details size brings the other along from the same decode; icon sizes come alone
+                self.generate(path, self.sizes if size in self.sizes else (size,))
+            return target
+        except (OSError, ValueError):
+            return None  # Missing source or not an image
+
+    def flush(self):
+        """Persist the manifest if any source was (re)hashed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._manifest)
+            self._dirty = False
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = self.manifest_path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(data)
+        os.replace(tmp, self.manifest_path)
+
+THUMB_STORE = ThumbnailStore()
+
+def decode_thumbnail(path, size):
+    """Path of the stored PNG derivative of an image at size, generated on first use.
+
+    The cache loads it straight into a PhotoImage, so once derivatives exist
+    neither startup nor scrolling imports Pillow.
+    """
+    return THUMB_STORE.ensure(path, size)
+
+# ---------- BACKGROUND IMAGE LOADING ----------
+IMAGE_WORKERS = min(4, os.cpu_count() or 1)
+IMAGE_POLL_MS = 15  # How often finished decodes are collected on the Tk thread
+IMAGE_RESULTS_PER_TICK = 64  # Cap PhotoImage creation per tick to keep the UI responsive
+
+class ImageLoader:
+    """Decodes thumbnails on a worker pool and hands PhotoImages back on the Tk thread"""
+
+    def __init__(self, root, cache=THUMB_CACHE, decoder=decode_thumbnail, workers=IMAGE_WORKERS):
+        self.root = root
+        self.cache = cache
+        self.decoder = decoder
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="thumbs")
+        self._done = queue.SimpleQueue()  # Futures finished by workers, drained by _poll
+        self._futures = {}  # future -> cache key
+        self._waiting = {}  # cache key -> callbacks for the current generation
+        self._polling = False
+
+    def request(self, path, size, callback):
+        """Return the cached PhotoImage for path, or None and call callback(photo) once decoded"""
+        key = self.cache.key(path, size)
+        if key is None:
+            return None
+        photo = self.cache.lookup(key)
+        if photo is not None:
+            return photo
+
+        callbacks = self._waiting.get(key)
+        if callbacks is not None:
+            callbacks.append(callback)  # Already being decoded for another row
+            return None
+        self._waiting[key] = [callback]
+        future = self._pool.submit(self._decode, path, size)
+        self._futures[future] = key
+        future.add_done_callback(self._done.put)
+        if not self._polling:
+            self._polling = True
+            self.root.after(IMAGE_POLL_MS, self._poll)
+        return None
+
+    def prefetch(self, path):
+        """Generate stored derivatives for path in the background"""
+        self._pool.submit(THUMB_STORE.ensure, path, THUMB_SIZES[0])
+
+    def cancel_all(self):
+        """Forget pending callbacks; decodes that have not started are cancelled outright"""
+        for future, key in list(self._futures.items()):
+            if future.cancel():
+                # Forgotten now, so a new request for the same key gets its own future and callbacks
+                del self._futures[future]
+                self._waiting.pop(key, None)
+            else:
+                self._waiting[key] = []  # Already running, later requests can still share it
+
+    def shutdown(self):
+        self.cancel_all()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        THUMB_STORE.flush()
+
+    @TRACE.traced("thumb.decode")
+    def _decode(self, path, size):
+        try:
+            return self.decoder(path, size)
+        except Exception:  # Any bad image (including Pillow's DecompressionBombError) just has no thumbnail
+            return None
+
+    @TRACE.traced("thumb.poll")
+    def _poll(self):
+        try:
+            for _ in range(IMAGE_RESULTS_PER_TICK):
+                try:
+                    future = self._done.get_nowait()
+                except queue.Empty:
+                    break
+                key = self._futures.pop(future, None)
+                if key is None:
+                    continue  # Cancelled by cancel_all, which already dropped its callbacks
+                callbacks = self._waiting.pop(key, ())
+                png = future.result()
+                if png is None:
+                    continue
+                # Results of cancelled generations are still cached, just not displayed
+                photo = self.cache.add(key, png)
+                if photo is None:
+                    continue
+                TRACE.count("thumbs decoded")
+                for callback in callbacks:
+                    callback(photo)
+        finally:
+            # Always reschedule, or one failing result would stop every later thumbnail
+            if self._futures:
+                self.root.after(IMAGE_POLL_MS, self._poll)
+            else:
+                self._polling = False
+                THUMB_STORE.flush()
+
+# ---------- LIST RECONCILIATION ----------
+def _stable_keys(keys, position):
+    """Return the keys that can stay put: a longest run already in increasing display order"""
+    tails = []  # tails[n] = index into keys of the smallest tail of a run of length n + 1
+    parent = {}
+    for i, key in enumerate(keys):
+        pos = position.get(key)
+        if pos is None:
+            continue
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if position[keys[tails[mid]]] < pos:
+                lo = mid + 1
+            else:
+                hi = mid
+        parent[i] = tails[lo - 1] if lo else None
+        if lo == len(tails):
+            tails.append(i)
+        else:
+            tails[lo] = i
+
+    stable = set()
+    i = tails[-1] if tails else None
+    while i is not None:
+        stable.add(keys[i])
+        i = parent[i]
+    return stable
+
+class TreeReconciler:
+    """Keeps a Treeview showing an ordered list of plants using the fewest item edits.
+
+    Every row's iid is its plant's ID, so rows map to plants without any
+    positional lookups. Rows whose plant leaves the list are deleted; the
+    tree only ever holds the list being shown.
+    """
+
+    def __init__(self, tree, on_row):
+        self.tree = tree
+        self.on_row = on_row  # Called with (iid, plant) when a row is inserted or changed
+        self.plants = {}  # iid (plant ID) -> plant
+        self.signatures = {}  # iid -> (name, image) as last rendered
+        self.order = []  # iids of attached rows, in display order
+
+    def iid_for(self, plant):
+        return plant.id if plant is not None and plant.id in self.plants else None
+
+    def plant_for(self, iid):
+        return self.plants.get(iid)
+
+    def sync(self, visible):
+        """Show the visible plants in order"""
+        tree = self.tree
+        keys = [p.id for p in visible]
+        wanted = set(keys)
+
+        # Rows already in the right relative order stay; rows leaving the list are
+        # deleted and the rest are detached, then placed at their index front to back
+        stable = _stable_keys(keys, {key: i for i, key in enumerate(self.order)})
+        gone, detach = [], []
+        for key in self.order:
+            if key not in wanted:
+                del self.plants[key]
+                del self.signatures[key]
+                gone.append(key)
+            elif key not in stable:
+                detach.append(key)
+        if gone:
+            tree.delete(*gone)
+        if detach:
+            tree.detach(*detach)
+
+        inserted = 0
+        for index, (key, plant) in enumerate(zip(keys, visible)):
+            if key not in self.plants:
+                tree.insert("", index, iid=key, text=plant.name)
+                inserted += 1
+                self.plants[key] = plant
+                self.signatures[key] = None
+            elif key not in stable:
+                tree.move(key, "", index)
+
+            signature = (plant.name, plant.image)
+            old = self.signatures[key]
+            if old == signature:
+                continue
+            if old is not None and old[0] != plant.name:
+                tree.item(key, text=plant.name)
+            self.signatures[key] = signature
+            self.on_row(key, plant)
+
+        self.order = keys
+        TRACE.count("rows inserted", inserted)
+        TRACE.count("rows deleted", len(gone))
+
+# ---------- VIRTUAL LIST ----------
+PLANT_ROW_HEIGHT = 48
+VIRTUAL_BUFFER_ROWS = 4  # Rows materialized below the viewport so scrolling shows no gaps
+
+class VirtualPlantList:
+    """Scrollable plant list that only materializes the rows in its viewport.
+
+    The Treeview never holds more than a screenful of items; scrolling moves a
+    window over the full result list and a TreeReconciler edits only the rows
+    that changed.
+    """
+
+    def __init__(self, tree, scrollbar, on_row, on_render=None, row_height=PLANT_ROW_HEIGHT):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows = TreeReconciler(tree, on_row)
+        self.on_render = on_render  # Called after every window change
+        self.row_height = row_height
+        self.plants = []  # Full ordered result, only a window of it is in the tree
+        self.top = 0  # Index of the first plant in the viewport
+
+        scrollbar.configure(command=self.yview)
+        tree.bind("<Configure>", lambda e: self.render())
+        tree.bind("<MouseWheel>", self._on_wheel)
+        tree.bind("<Button-4>", lambda e: self._scroll_by(-1))
+        tree.bind("<Button-5>", lambda e: self._scroll_by(1))
+
+    def capacity(self):
+        """Rows that fit in the viewport"""
+        return max(1, self.tree.winfo_height() // self.row_height)
+
+    def set_plants(self, plants, reset=False):
+        """Show a new result list, keeping the scroll position unless reset"""
+        self.plants = plants
+        if reset:
+            self.top = 0
+        self.render()
+
+    @TRACE.traced("list.render")
+    def render(self):
+        self.top = max(0, min(self.top, len(self.plants) - self.capacity()))
+        end = self.top + self.capacity() + VIRTUAL_BUFFER_ROWS
+        self.rows.sync(self.plants[self.top:end])
+        self.tree.yview_moveto(0)
+
+        total = len(self.plants)
+        if total:
+            self.scrollbar.set(self.top / total, min(1.0, (self.top + self.capacity()) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        if self.on_render is not None:
+            self.on_render()
+
+    def scroll_to(self, top):
+        top = max(0, min(int(top), len(self.plants) - self.capacity()))
+        if top != self.top:
+            self.top = top
+            self.render()
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"|"pages")"""
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self.plants))
+        elif args[0] == "scroll":
+            step = self.capacity() if args[2] == "pages" else 1
+            self.scroll_to(self.top + int(args[1]) * step)
+
+    def _scroll_by(self, rows):
+        self.scroll_to(self.top + rows)
+        return "break"  # Keep the Treeview from scrolling its own (tiny) item list
+
+    def _on_wheel(self, event):
+        # Windows reports multiples of 120, macOS reports small deltas
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_by(-delta * 3)
+
+# ---------- SEARCH ----------
+SEARCH_DEBOUNCE_MS = 150  # Keystrokes closer together than this are coalesced into one search
+
+# ---------- REMINDER SCHEDULER ----------
+REMINDER_MAX_SLEEP_MS = 60 * 60 * 1000  # Longest timer; catches clock changes and suspend/resume
+REMINDER_NAMES = 5  # Reminders for more plants than this show a count instead of names
+
+class ReminderScheduler:
+    """Sleeps until the next plant comes due, then announces everything due that day.
+
+    The due index is kept sorted, so finding the next wake-up is one binary
+    search. Changes to the collection re-aim the single pending root.after
+    timer; nothing ever polls the whole collection.
+    """
+
+    def __init__(self, root, plants, on_due):
+        self.root = root
+        self.plants = plants
+        self.on_due = on_due  # Called with the plants that came due whenever the date changes
+        self.reminded = date.today().toordinal()  # Plants due on or before this day were already announced
+        self.wake = None  # Due ordinal the pending timer is aimed at
+        self._job = None
+        plants.subscribe(self._on_change)
+        self.schedule()
+
+    def _on_change(self, event, plants):
+        self.schedule()
+
+    def schedule(self):
+        """Aim the timer at midnight of the next day a plant comes due"""
+        day = self.plants.next_due_after(self.reminded)
+        if self._job is not None:
+            if day == self.wake:
+                return
+            self.root.after_cancel(self._job)
+            self._job = None
+        self.wake = day
+        if day is None:
+            return
+        seconds = time.mktime(date.fromordinal(day).timetuple()) - time.time()
+        delay = min(REMINDER_MAX_SLEEP_MS, max(0, int(seconds * 1000) + 1))
+        self._job = self.root.after(delay, self._fire)
+
+    def _fire(self):
+        self._job = None
+        today = date.today().toordinal()
+        if today > self.reminded:
+            due = self.plants.due_plants(after=self.reminded)
+            self.reminded = today
+            self.on_due(due)
+        self.schedule()
+
+    def cancel(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+
+# ---------- TOASTS ----------
+TOAST_POOL_SIZE = 3  # Toasts on screen at once; their windows are reused
+TOAST_QUEUE_MAX = 20  # Waiting toasts beyond this push out the oldest
+TOAST_INTERVAL_MS = 250  # Minimum gap between two toasts appearing
+TOAST_MARGIN = 20  # Distance from the main window's bottom-right corner
+TOAST_GAP = 8  # Space between stacked toasts
+
+def plant_count(count):
+    """Count with the noun agreeing, e.g. 1 plant or 3 plants"""
+    return f"{count} plant" if count == 1 else f"{count} plants"
+
+class Toast:
+    """One notification, waiting in the queue or on screen"""
+    __slots__ = ("key", "message", "summary", "count", "merged", "duration", "window", "job")
+
+    def __init__(self, key, message, summary, count, duration):
+        self.key = key  # Toasts with the same key are merged
+        self.message = message
+        self.summary = summary  # Text once merged, formatted with {count}
+        self.count = count
+        self.merged = False
+        self.duration = duration
+        self.window = None  # Pooled (toplevel, frame, label) while on screen
+        self.job = None  # Pending auto-close
+
+    @property
+    def text(self):
+        if not self.merged:
+            return self.message
+        if self.summary:
+            return self.summary.format(count=self.count)
+        return f"{self.message} (x{self.count})"
+
+class ToastManager:
+    """Shows toasts in a small pool of reusable windows stacked above one another.
+
+    Messages wait in a bounded queue and appear at most one per interval.
+    A message whose key matches a waiting or visible toast is merged into it,
+    so a burst of similar notifications becomes one toast such as
+    "5 plants need water".
+    """
+
+    def __init__(self, root, pool_size=TOAST_POOL_SIZE, queue_max=TOAST_QUEUE_MAX, interval=TOAST_INTERVAL_MS):
+        self.root = root
+        self.pool_size = pool_size
+        self.interval = interval
+        self.queue = deque(maxlen=queue_max)  # Toasts waiting for a window
+        self.visible = []  # Toasts on screen, bottom one first
+        self.pool = []  # Idle windows ready for reuse
+        self.last_shown = 0.0
+        self._pump_job = None
+
+    def show(self, message, duration=3000, key=None, summary=None, count=1):
+        """Queue a toast, or fold it into a waiting or visible one with the same key"""
+        key = message if key is None else key
+        for toast in (*self.visible, *self.queue):
+            if toast.key == key:
+                toast.count += count
+                toast.merged = True
+                toast.message = message
+                toast.summary = summary or toast.summary
+                toast.duration = max(toast.duration, duration)
+                if toast.window is not None:
+                    self._display(toast)
+                return
+        self.queue.append(Toast(key, message, summary, count, duration))
+        if self._pump_job is None:
+            self._pump()
+
+    def _pump(self):
+        """Move the next queued toast on screen, respecting the pool and the rate limit"""
+        self._pump_job = None
+        if not self.queue or len(self.visible) >= self.pool_size:
+            return  # Resumed when a toast closes
+        wait = self.last_shown + self.interval / 1000 - time.monotonic()
+        if wait > 0:
+            self._pump_job = self.root.after(int(wait * 1000) + 1, self._pump)
+            return
+        toast = self.queue.popleft()
+        toast.window = self.pool.pop() if self.pool else self._build()
+        self.visible.append(toast)
+        self._display(toast)
+        toast.window[0].deiconify()
+        self.last_shown = time.monotonic()
+        if self.queue:
+            self._pump_job = self.root.after(self.interval, self._pump)
+
+    def _build(self):
+        window = tk.Toplevel(self.root)
+        window.withdraw()
+        window.wm_overrideredirect(True)
+        window.wm_attributes('-alpha', 0.9)
+        frame = tk.Frame(window, highlightthickness=1)
+        frame.pack(padx=1, pady=1)
+        label = tk.Label(frame, font=("Arial", 10), padx=20, pady=10)
+        label.pack()
+        return window, frame, label
+
+    def _display(self, toast):
+        """Show the toast's current text and restart its auto-close timer"""
+        window, frame, label = toast.window
+        window.configure(bg=THEME["bg_panel"])
+        frame.configure(bg=THEME["btn"], highlightbackground=THEME["input_border"])
+        label.configure(text=toast.text, bg=THEME["btn"], fg=THEME["btn_text"])
+        if toast.job is not None:
+            self.root.after_cancel(toast.job)
+        toast.job = self.root.after(toast.duration, lambda: self._close(toast))
+        self._restack()
+
+    def _restack(self):
+        """Stack visible toasts upwards from the bottom-right corner without overlap"""
+        right = self.root.winfo_x() + self.root.winfo_width() - TOAST_MARGIN
+        y = self.root.winfo_y() + self.root.winfo_height() - TOAST_MARGIN
+        for toast in self.visible:
+            label = toast.window[2]
+            # Label plus the frame's border and padding; known without waiting for idle geometry
+            width = label.winfo_reqwidth() + 4
+            height = label.winfo_reqheight() + 4
+            y -= height
+            toast.window[0].geometry(f"+{right - width}+{y}")
+            y -= TOAST_GAP
+
+    def _close(self, toast):
+        toast.job = None
+        self.visible.remove(toast)
+        window = toast.window
+        toast.window = None
+        try:
+            window[0].withdraw()
+        except tk.TclError:
+            return  # The main window is already gone
+        self.pool.append(window)
+        self._restack()
+        if self._pump_job is None:
+            self._pump()
+
+
 # Load image icons and resize them for consistent UI appearance
 def load_icon(filename, size):
+    """Icon at size, read from a derivative pre-rasterized on the first run"""
     path = os.path.join("images", filename)
     if not os.path.exists(path):
         return None  # Return None if icon file not found
-    return ImageTk.PhotoImage(Image.open(path).resize(size, Image.LANCZOS))
+    return THUMB_CACHE.get(path, size, decode_thumbnail)
+
+# ---------- PERFORMANCE OVERLAY ----------
+PERF_REFRESH_MS = 500  # How often the overlay redraws its numbers
+LAG_PROBE_MS = 50  # Period of the timer whose lateness measures event-loop lag
+
+def trace_file_arg(argv):
+    """File named after --trace on the command line, or None"""
+    if "--trace" in argv[:-1]:
+        return argv[argv.index("--trace") + 1]
+    return None
+
+def widget_count(root):
+    """Number of live widgets under root, root included"""
+    count, stack = 0, [root]
+    while stack:
+        widget = stack.pop()
+        count += 1
+        stack.extend(widget.winfo_children())
+    return count
+
+class LagProbe:
+    """Timer recording how late the event loop runs it, as "event loop lag" spans, while tracing is on"""
+
+    def __init__(self, root):
+        self.root = root
+        self.expected = 0.0  # perf_counter() the pending tick is due at
+        self._job = None
+
+    def start(self):
+        if self._job is None:
+            self._arm()
+
+    def _arm(self):
+        self.expected = time.perf_counter() + LAG_PROBE_MS / 1000
+        self._job = self.root.after(LAG_PROBE_MS, self._tick)
+
+    def _tick(self):
+        self._job = None
+        if TRACE.enabled:  # Otherwise stop until start() is called again
+            TRACE.record("event loop lag", self.expected, max(self.expected, time.perf_counter()))
+            self._arm()
+
+class PerfOverlay:
+    """Small always-on-top window with rolling span latencies and live resource counts.
+
+    Shows p50/p99/max of every span in TRACE (event-loop lag included), the
+    thumbnail cache hit rate, widget and PhotoImage counts and the counters.
+    It only reads shared state; the app turns tracing on while it is open.
+    """
+
+    def __init__(self, root, theme, make_button, on_close):
+        self.root = root
+        self.on_close = on_close
+        self.win = theme.add(tk.Toplevel(root), "panel")
+        self.win.title("Performance")
+        self.win.configure(bg=THEME["bg_panel"])
+        self.win.attributes("-topmost", True)
+        self.win.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.text = tk.StringVar(self.win, "")
+        theme.add(tk.Label(self.win, textvariable=self.text, font=("Courier", 10), justify="left", anchor="nw",
+                           bg=THEME["bg_panel"], fg=THEME["text"]), "panel_label").pack(fill="both", padx=10, pady=10)
+        self.status = tk.StringVar(self.win, "")
+        theme.add(tk.Label(self.win, textvariable=self.status, bg=THEME["bg_panel"], fg=THEME["text"]),
+                  "panel_label").pack()
+        btns = theme.add(tk.Frame(self.win, bg=THEME["bg_panel"]), "panel")
+        btns.pack(pady=10)
+        make_button(btns, "Reset", TRACE.reset).grid(row=0, column=0, padx=5)
+        make_button(btns, "Dump Trace", self.dump).grid(row=0, column=1, padx=5)
+
+        self._job = None
+        self.refresh()
+
+    def refresh(self):
+        lines = [f"{'span':<20}{'calls':>6}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}"]
+        for name, (calls, p50, p99, worst) in sorted(TRACE.percentiles().items()):
+            lines.append(f"{name:<20}{calls:>6}{p50:>9.2f}{p99:>9.2f}{worst:>9.2f}")
+
+        cache = THUMB_CACHE.stats()
+        lines.append("")
+        lines.append(f"thumbnail cache     {cache['hit_rate']:>6.0%} hits of {cache['hits'] + cache['misses']},"
+                     f" {cache['entries']} images, {cache['bytes'] / (1024 * 1024):.1f} MB")
+        lines.append(f"widgets             {widget_count(self.root):>6}")
+        lines.append(f"PhotoImages         {len(self.root.image_names()):>6}")
+        for name, value in sorted(TRACE.totals().items()):
+            lines.append(f"{name:<20}{value:>6}")
+        self.text.set("\n".join(lines))
+        self._job = self.root.after(PERF_REFRESH_MS, self.refresh)
+
+    def dump(self):
+        """Save the recorded spans as a Chrome trace wherever the user picks"""
+        path = filedialog.asksaveasfilename(parent=self.win, defaultextension=".json",
+                                            initialfile="plantpal-trace.json", filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            count = TRACE.dump(path)
+        except OSError as e:
+            self.status.set(f"Dump failed: {e}")
+            return
+        self.status.set(f"{count} spans written to {os.path.basename(path)}")
+
+    def close(self):
+        if self._job is not None:
+            self.root.after_cancel(self._job)
+            self._job = None
+        self.win.destroy()
+        self.on_close()
+
+# ---------- STARTUP ----------
+STATS_CACHE = "dashboard.json"  # Last session's dashboard numbers, painted while plants load
+SAVE_POLL_MS = 50  # How often Save Plants checks whether its background write has finished
+
+def read_stats_cache(path=STATS_CACHE):
+    """Dashboard stats saved on the last exit, if they were taken today"""
+    try:
+        with open(path, "r") as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return stats if stats.get("date") == date.today().isoformat() else None
 
 class MyPlantPal:
     def __init__(self, root):
@@ -50,13 +877,29 @@ class MyPlantPal:
         self.current_theme = "dark"
 
         # Initialize data structures for storing plant information and UI state
-        self.plants = []  # List of all plant dictionaries
-        self.buttons = []  # Track all buttons for theme updates
-        self.tree_items = []  # Tree item IDs for each displayed plant
-        self.plant_thumbs = []  # Plant thumbnail images for treeview
-        self.filtered_plants = []  # Track filtered plant indices from search
-        self.toast_windows = []  # Track open toast notification windows
-        self.selected_plant_item = None  # Current selected plant item for highlighting
+        self.plants = PlantCollection()  # All plants with their search and due-date indexes
+        self.storage = open_storage()  # Where plants are loaded from and changes are written
+        self.history = WateringLog()  # Every watering, with per-plant aggregates
+        self.startup_times = [] if "--startup-time" in sys.argv else None  # (stage, ms) when measuring
+        self.trace_file = trace_file_arg(sys.argv)  # Every span is recorded and written here on exit
+        self.overlay = None  # Performance overlay, toggled with F12
+        self.lag_probe = LagProbe(self.root)
+        self.search_job = None  # Pending debounced search
+        self.dashboard_job = None  # Pending dashboard refresh
+        self.theme = ThemeRegistry()  # Live widgets restyled when the theme changes
+        self.toasts = ToastManager(self.root)  # Queues, merges and stacks notifications
+        self.plant_thumbs = {}  # Tree item ID (the plant's ID) -> thumbnail shown in that on-screen row
+        self.pending_thumbs = {}  # Tree item ID -> plant whose thumbnail is still decoding
+        self.plant_tree = None  # Plants page widgets are built on its first visit
+        self.selection = {}  # plant ID -> selected plant, on screen or not, in the order picked
+        self.selected_plant = None  # Most recently clicked selected plant; the one Details shows
+        self.anchor = None  # Result-list index that Shift-click ranges start from
+        self.images = ImageLoader(self.root)  # Decodes plant thumbnails off the Tk thread
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.bind_all("<F12>", self.toggle_overlay)
+        if self.trace_file is not None:
+            TRACE.enabled = True
+            self.lag_probe.start()
 
         # Load icons for UI buttons and plant thumbnails
         self.icon_add = load_icon("add.png", (20, 20))
@@ -66,10 +909,12 @@ class MyPlantPal:
         self.icon_default = load_icon("default.png", (40, 40))  # Fallback icon if plant image missing
 
         self.root.configure(bg=THEME["bg_main"])
+        self.theme.add(self.root, "main")
 
         # ---------- HEADER ----------
         self.header_frame = tk.Frame(self.root, bg=THEME["header_bg"], height=50)
         self.header_frame.pack(fill="x")
+        self.theme.add(self.header_frame, "header")
 
         self.title_label = tk.Label(
             self.header_frame, text=" My Plant Pal",
@@ -78,6 +923,7 @@ class MyPlantPal:
             image=self.icon_leaf, compound="left"
         )
         self.title_label.pack(side="left", padx=10)
+        self.theme.add(self.title_label, "header_label")
 
         self.btn_dashboard = self._header_button("Dashboard", self.show_dashboard)
         self.btn_dashboard.pack(side="left", padx=5)
@@ -90,22 +936,52 @@ class MyPlantPal:
 
         # ---------- PAGES ----------
         # Create frame containers for dashboard and plants pages
-        self.dashboard_frame = tk.Frame(self.root, bg=THEME["bg_main"])
-        self.plants_frame = tk.Frame(self.root, bg=THEME["bg_main"])
+        self.dashboard_frame = self.theme.add(tk.Frame(self.root, bg=THEME["bg_main"]), "main")
+        self.plants_frame = self.theme.add(tk.Frame(self.root, bg=THEME["bg_main"]), "main")
 
         # Show dashboard first
         self.dashboard_frame.pack(fill="both", expand=True)
 
-        # Load plant data from JSON file before rendering UI
+        # Plants stream in from the event loop; until they are all loaded the
+        # dashboard shows last session's numbers
         self.load_plants()
 
-        # Build UI page components
+        # Only the dashboard is built now; the dashboard then follows collection changes
         self.build_dashboard()
-        self.build_plants_page()
-
-        # Refresh plant list display and show any pending watering reminders
-        self.update_list()
-        self.check_watering_reminders()
+        self.plants.subscribe(self._schedule_dashboard)
+
+        # Reminders wait until every plant is loaded
+        self.root.after(1, self._load_next_chunk)
+        if self.startup_times is not None:
+            self._mark_startup("window built")
+            self.root.bind("<Expose>", self._first_frame)
+
+    def on_close(self):
+        """Stop background work and flush unsaved changes before the window goes away"""
+        if self.loader is not None and self.plants.dirty:
+            try:
+                for chunk in self.loader:
+                    self.plants.extend(chunk, "loaded")  # Saving must see the whole collection
+            except Exception:
+                pass  # The storage is now failed and writes nothing
+            else:
+                self.loader = None
+        if self.loader is None and self.storage.failed is None:
+            try:
+                write_json_atomic(STATS_CACHE, dict(self.get_stats(), date=date.today().isoformat()))
+            except OSError:
+                pass  # Only costs the next start its early numbers
+        # Nothing changed, so an unfinished load is just dropped; the unread plants stay on disk
+        self.loader = None
+        self.images.shutdown()
+        self.storage.close()
+        self.history.close()
+        if self.trace_file is not None:
+            try:
+                TRACE.dump(self.trace_file)
+            except OSError as e:
+                print(f"Could not write trace: {e}", file=sys.stderr)
+        self.root.destroy()
 
     # ---------- HEADER BUTTON ----------
     def _header_button(self, text, command):
@@ -121,7 +997,7 @@ class MyPlantPal:
 
     # ---------- BUTTON STYLE ----------
     def _style_button(self, btn):
-        self.buttons.append(btn)
+        self.theme.add(btn, "button")
         btn.bind("<Enter>", lambda e: btn.config(bg=THEME["btn_hover"]))
         btn.bind("<Leave>", lambda e: btn.config(bg=THEME["btn"]))
 
@@ -137,38 +1013,26 @@ class MyPlantPal:
         return btn
 
     # ---------- TOAST NOTIFICATIONS ----------
-    def show_toast(self, message, duration=3000):
-        """Display a toast notification that auto-closes after specified duration (ms)"""
-        toast = tk.Toplevel(self.root)
-        toast.wm_overrideredirect(True)
-        toast.wm_attributes('-alpha', 0.9)
-        toast.configure(bg=THEME["bg_panel"])
-        
-        # Create a frame with border for card effect
-        frame = tk.Frame(toast, bg=THEME["btn"], highlightthickness=1, highlightbackground=THEME["input_border"])
-        frame.pack(padx=1, pady=1)
-        
-        label = tk.Label(frame, text=message, bg=THEME["btn"], fg=THEME["btn_text"],
-                        font=("Arial", 10), padx=20, pady=10)
-        label.pack()
-        
-        # Position at bottom right
-        toast.update_idletasks()
-        x = self.root.winfo_x() + self.root.winfo_width() - toast.winfo_width() - 20
-        y = self.root.winfo_y() + self.root.winfo_height() - toast.winfo_height() - 20
-        toast.geometry(f"+{x}+{y}")
-        
-        self.toast_windows.append(toast)
-        
-        # Auto-close
-        toast.after(duration, lambda: self._close_toast(toast))
-    
-    def _close_toast(self, toast):
-        try:
-            toast.destroy()
-            self.toast_windows.remove(toast)
-        except:
-            pass
+    def show_toast(self, message, duration=3000, key=None, summary=None, count=1):
+        """Display a toast notification that auto-closes after specified duration (ms).
+
+        Toasts sharing a key are merged; summary is the merged text, formatted with {count}.
+        """
+        self.toasts.show(message, duration, key, summary, count)
+
+    # ---------- PERFORMANCE OVERLAY ----------
+    def toggle_overlay(self, event=None):
+        """Show or hide the performance overlay; spans are recorded while it is open"""
+        if self.overlay is not None:
+            self.overlay.close()
+            return
+        TRACE.enabled = True
+        self.lag_probe.start()
+        self.overlay = PerfOverlay(self.root, self.theme, self._create_button, self._overlay_closed)
+
+    def _overlay_closed(self):
+        self.overlay = None
+        TRACE.enabled = self.trace_file is not None  # --trace keeps recording until exit
 
     # ---------- THEME ----------
     def toggle_theme(self):
@@ -184,17 +1048,10 @@ class MyPlantPal:
             self.dark_mode_btn.config(text="Dark Mode")
         self.apply_theme()  # Reapply all colors to UI components
 
+    @TRACE.traced("apply_theme")
     def apply_theme(self):
-        """Apply current theme colors to all UI components"""
-        self.root.configure(bg=THEME["bg_main"])
-        self.header_frame.configure(bg=THEME["header_bg"])
-        self.title_label.configure(bg=THEME["header_bg"], fg=THEME["header_text"])
-        self.dashboard_frame.configure(bg=THEME["bg_main"])
-        self.plants_frame.configure(bg=THEME["bg_main"])
-
-        # Update all buttons with new theme colors
-        for btn in self.buttons:
-            btn.configure(bg=THEME["btn"], fg=THEME["btn_text"])
+        """Restyle every live widget in place; pages, rows and thumbnails are kept"""
+        self.theme.restyle()
 
         if hasattr(self, "style"):
             self.style.configure(
@@ -204,97 +1061,126 @@ class MyPlantPal:
                 foreground=THEME["list_fg"]
             )
 
-        self.build_dashboard()
-        self.build_plants_page()
-        self.update_list()
-
     # ---------- PAGE SWITCH ----------
     def show_dashboard(self):
         self.plants_frame.pack_forget()
         self.dashboard_frame.pack(fill="both", expand=True)
-        self.build_dashboard()
+        self.refresh_dashboard()  # Cheap, and catches the date rolling over
 
     def show_plants_page(self):
         self.dashboard_frame.pack_forget()
         self.plants_frame.pack(fill="both", expand=True)
+        if self.plant_tree is None:
+            self.build_plants_page()
+            self.update_list()
 
     # ---------- DASHBOARD ----------
+    @TRACE.traced("build_dashboard")
     def build_dashboard(self):
-        for w in self.dashboard_frame.winfo_children():
-            w.destroy()
-
-        stats = self.get_stats()
-
+        """Create the dashboard widgets once; refresh_dashboard fills in the numbers"""
         # Stat cards
-        card_frame = tk.Frame(self.dashboard_frame, bg=THEME["bg_main"])
+        theme = self.theme
+        card_frame = theme.add(tk.Frame(self.dashboard_frame, bg=THEME["bg_main"]), "main")
         card_frame.pack(pady=20)
 
-        def card(label, value, color):
+        self.stat_vars = {}  # Stat name -> StringVar shown on its card
+
+        def card(label, key, color):
             # Shadow effect with nested frames
-            shadow = tk.Frame(card_frame, bg=THEME["bg_main"], height=2)
-            c = tk.Frame(shadow, bg=THEME["bg_panel"], padx=20, pady=15, relief="raised", bd=2)
+            shadow = theme.add(tk.Frame(card_frame, bg=THEME["bg_main"], height=2), "main")
+            c = theme.add(tk.Frame(shadow, bg=THEME["bg_panel"], padx=20, pady=15, relief="raised", bd=2), "panel")
             c.pack(side="top")
             shadow.pack(side="left", padx=8, pady=10)
-            tk.Label(c, text=value, font=("Arial", 20, "bold"), fg=color, bg=THEME["bg_panel"]).pack()
-            tk.Label(c, text=label, font=("Arial", 10), fg=THEME["text"], bg=THEME["bg_panel"]).pack()
+            value = self.stat_vars[key] = tk.StringVar(self.root, "0")
+            theme.add(tk.Label(c, textvariable=value, font=("Arial", 20, "bold"), fg=color, bg=THEME["bg_panel"]),
+                      "panel").pack()
+            theme.add(tk.Label(c, text=label, font=("Arial", 10), fg=THEME["text"], bg=THEME["bg_panel"]),
+                      "panel_label").pack()
 
-        card("Total Plants", stats["total"], "#2E7D32")
-        card("Need Water Today", stats["today"], "#0277BD")
-        card("Overdue", stats["overdue"], "#C62828")
+        card("Total Plants", "total", "#2E7D32")
+        card("Need Water Today", "today", "#0277BD")
+        card("Overdue", "overdue", "#C62828")
 
         # Health bar
-        bar_frame = tk.Frame(self.dashboard_frame, bg=THEME["bg_main"])
+        bar_frame = theme.add(tk.Frame(self.dashboard_frame, bg=THEME["bg_main"]), "main")
         bar_frame.pack(pady=20)
 
-        tk.Label(bar_frame, text="Plant Health Overview",
-                 font=("Arial", 12, "bold"),
-                 bg=THEME["bg_main"], fg=THEME["text"]).pack()
+        theme.add(tk.Label(bar_frame, text="Plant Health Overview",
+                           font=("Arial", 12, "bold"),
+                           bg=THEME["bg_main"], fg=THEME["text"]), "label").pack()
 
-        canvas = tk.Canvas(bar_frame, width=400, height=30,
-                           bg=THEME["bg_panel"], highlightthickness=1,
-                           highlightbackground=THEME["input_border"])
+        canvas = theme.add(tk.Canvas(bar_frame, width=400, height=30,
+                                     bg=THEME["bg_panel"], highlightthickness=1,
+                                     highlightbackground=THEME["input_border"]), "canvas")
         canvas.pack(pady=10)
+        self.health_canvas = canvas
 
-        total = max(stats["total"], 1)
-        x = 0
+        # Healthy, due today and overdue segments, resized with coords on every refresh
+        self.health_bars = [canvas.create_rectangle(0, 0, 0, 30, fill=color, width=0)
+                            for color in ("#66BB6A", "#FFCA28", "#EF5350")]
 
-        def bar(width, color):
-            nonlocal x
-            canvas.create_rectangle(x, 0, x + width, 30, fill=color, width=0)
-            x += width
+        # Upcoming waterings, one bar per day
+        theme.add(tk.Label(bar_frame, text=f"Due in the Next {FORECAST_DAYS} Days",
+                           font=("Arial", 12, "bold"),
+                           bg=THEME["bg_main"], fg=THEME["text"]), "label").pack(pady=(10, 0))
+
+        forecast = theme.add(tk.Canvas(bar_frame, width=400, height=60,
+                                       bg=THEME["bg_panel"], highlightthickness=1,
+                                       highlightbackground=THEME["input_border"]), "canvas")
+        forecast.pack(pady=10)
+        self.forecast_canvas = forecast
 
-        bar((stats["healthy"] / total) * 400, "#66BB6A")
-        bar((stats["today"] / total) * 400, "#FFCA28")
-        bar((stats["overdue"] / total) * 400, "#EF5350")
+        width = 400 / FORECAST_DAYS
+        self.forecast_bars = [forecast.create_rectangle(day * width + 1, 60, (day + 1) * width - 1, 60,
+                                                        fill="#0277BD" if day else "#FFCA28", width=0)
+                              for day in range(FORECAST_DAYS)]
 
         # Quick actions
-        actions = tk.Frame(self.dashboard_frame, bg=THEME["bg_main"])
+        actions = theme.add(tk.Frame(self.dashboard_frame, bg=THEME["bg_main"]), "main")
         actions.pack(pady=20)
 
         self._create_button(actions, "Add Plant", self.add_plant_window).pack(side="left", padx=10)
         self._create_button(actions, "View Plants", self.show_plants_page).pack(side="left", padx=10)
 
+        self.refresh_dashboard()
+
+    @TRACE.traced("refresh_dashboard")
+    def refresh_dashboard(self):
+        """Update the card values and chart bars in place from the current statistics"""
+        self.dashboard_job = None
+        stats = self.get_stats()
+        for key, value in self.stat_vars.items():
+            value.set(stats[key])
+
+        total = max(stats["total"], 1)
+        x = 0
+        for bar, key in zip(self.health_bars, ("healthy", "today", "overdue")):
+            width = (stats[key] / total) * 400
+            self.health_canvas.coords(bar, x, 0, x + width, 30)
+            x += width
+
+        counts = stats["forecast"]
+        peak = max(max(counts), 1)
+        width = 400 / FORECAST_DAYS
+        for day, (bar, count) in enumerate(zip(self.forecast_bars, counts)):
+            height = (count / peak) * 56
+            self.forecast_canvas.coords(bar, day * width + 1, 60 - height, (day + 1) * width - 1, 60)
+
+    def _schedule_dashboard(self, event=None, plants=None):
+        """Refresh the dashboard once, after the current burst of collection changes"""
+        if self.dashboard_job is None:
+            self.dashboard_job = self.root.after_idle(self.refresh_dashboard)
+
     # ---------- STATS ----------
     def get_stats(self):
         """Calculate plant health statistics for dashboard display"""
-        today = datetime.now().date()
-        total = len(self.plants)
-        today_due = overdue = healthy = 0
-
-        # Categorize each plant based on watering schedule
-        for p in self.plants:
-            last = datetime.strptime(p["last_watered"], "%Y-%m-%d").date()
-            due = last + timedelta(days=p["water"])  # Calculate next watering date
-            if today > due:
-                overdue += 1  # Plant needs water urgently
-            elif today == due:
-                today_due += 1  # Plant needs water today
-            else:
-                healthy += 1  # Plant is fine, not due yet
-
-        return {"total": total, "today": today_due, "overdue": overdue, "healthy": healthy}
+        if self.loader is not None and self.cached_stats is not None:
+            return self.cached_stats  # Still loading, last session's numbers are closer
+        # Overdue: past due date, today: due today, healthy: not due yet
+        return self.plants.summary(days=FORECAST_DAYS)
 
     # ---------- PLANTS PAGE ----------
+    @TRACE.traced("build_plants_page")
     def build_plants_page(self):
         for w in self.plants_frame.winfo_children():
             w.destroy()
@@ -302,7 +1188,7 @@ class MyPlantPal:
         self.style = ttk.Style(self.root)
         self.style.configure(
             "PlantTreeview",
-            rowheight=48,
+            rowheight=PLANT_ROW_HEIGHT,
             background=THEME["list_bg"],
             fieldbackground=THEME["list_bg"],
             foreground=THEME["list_fg"],
@@ -311,20 +1197,42 @@ class MyPlantPal:
         self.style.layout("PlantTreeview", [("Treeview.treearea", {"sticky": "nswe"})])
 
         # Search frame
-        search_frame = tk.Frame(self.plants_frame, bg=THEME["bg_main"])
+        theme = self.theme
+        search_frame = theme.add(tk.Frame(self.plants_frame, bg=THEME["bg_main"]), "main")
         search_frame.pack(fill="x", padx=10, pady=10)
         
-        tk.Label(search_frame, text="Search Plants:", bg=THEME["bg_main"], fg=THEME["text"]).pack(side="left", padx=5)
+        theme.add(tk.Label(search_frame, text="Search Plants:", bg=THEME["bg_main"], fg=THEME["text"]),
+                  "label").pack(side="left", padx=5)
         
         self.search_var = tk.StringVar()
-        search_entry = tk.Entry(search_frame, textvariable=self.search_var, 
-                               bg=THEME["entry_bg"], fg=THEME["entry_fg"],
-                               insertbackground=THEME["entry_fg"], width=30)
+        search_entry = theme.add(tk.Entry(search_frame, textvariable=self.search_var,
+                                          bg=THEME["entry_bg"], fg=THEME["entry_fg"],
+                                          insertbackground=THEME["entry_fg"], width=30), "entry")
         search_entry.pack(side="left", padx=5)
-        search_entry.bind("<KeyRelease>", lambda e: self.filter_plants())
-
-        self.plant_tree = ttk.Treeview(self.plants_frame, style="PlantTreeview", show="tree")
-        self.plant_tree.pack(fill="both", expand=True, pady=5)
+        search_entry.bind("<KeyRelease>", lambda e: self._schedule_search())
+
+        self.selection_var = tk.StringVar(self.root, "")
+        theme.add(tk.Label(search_frame, textvariable=self.selection_var, bg=THEME["bg_main"], fg=THEME["text"]),
+                  "label").pack(side="right", padx=5)
+
+        list_frame = theme.add(tk.Frame(self.plants_frame, bg=THEME["bg_main"]), "main")
+        list_frame.pack(fill="both", expand=True, pady=5)
+
+        # Only the rows on screen exist as tree items, so the (extended) selection is
+        # tracked by plant ID here rather than by the Treeview
+        self.plant_tree = ttk.Treeview(list_frame, style="PlantTreeview", show="tree", selectmode="none")
+        self.plant_tree.tag_configure("selected", background="#B8860B")
+        self.plant_tree.tag_configure("hover", background="#2E7D32")
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical")
+        scrollbar.pack(side="right", fill="y")
+        self.plant_tree.pack(side="left", fill="both", expand=True)
+        self.plant_list = VirtualPlantList(self.plant_tree, scrollbar, self._render_row, self._load_pending_thumbs)
+        self.plant_thumbs = {}
+        self.pending_thumbs = {}
+        self.selection = {}
+        self.selected_plant = None
+        self.anchor = None
+        self.last_query = None
         
         # Bind hover effects
         self.plant_tree.bind("<Motion>", self._on_treeview_hover)
@@ -332,107 +1240,178 @@ class MyPlantPal:
         self.plant_tree.bind("<Button-1>", self._on_treeview_click)
         self.last_hovered_item = None
 
-        btns = tk.Frame(self.plants_frame, bg=THEME["bg_main"])
+        btns = theme.add(tk.Frame(self.plants_frame, bg=THEME["bg_main"]), "main")
         btns.pack(pady=10)
 
         self._create_button(btns, "Add Plant", self.add_plant_window, self.icon_add).grid(row=0, column=0, padx=5)
         self._create_button(btns, "Details", self.show_details).grid(row=0, column=1, padx=5)
-        self._create_button(btns, "Delete", self.delete_plant, self.icon_delete).grid(row=0, column=2, padx=5)
-
-        self._create_button(self.plants_frame, "Save Plants", self.save_plants).pack(pady=5)
-
+        self._create_button(btns, "Water", self.water_selected, self.icon_water).grid(row=0, column=2, padx=5)
+        self._create_button(btns, "Edit", self.edit_selected_window).grid(row=0, column=3, padx=5)
+        self._create_button(btns, "Delete", self.delete_plant, self.icon_delete).grid(row=0, column=4, padx=5)
+
+        save_btns = theme.add(tk.Frame(self.plants_frame, bg=THEME["bg_main"]), "main")
+        save_btns.pack(pady=5)
+        self._create_button(save_btns, "Save Plants", self.save_plants).grid(row=0, column=0, padx=5)
+        self._create_button(save_btns, "Export", self.export_plants).grid(row=0, column=1, padx=5)
+
+    def _schedule_search(self):
+        """Run the search once typing pauses, dropping the intermediate keystrokes"""
+        if self.search_job is not None:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self.search_job = None
+        if self.search_var.get() != self.last_query:
+            self.filter_plants()
+
+    @TRACE.traced("filter_plants")
     def filter_plants(self):
-        """Filter and display plants based on search query"""
-        query = self.search_var.get().lower()
-        
-        # Clear current treeview display
-        for item in self.plant_tree.get_children():
-            self.plant_tree.delete(item)
-        
-        # Reset tracking lists
-        self.tree_items = []
-        self.plant_thumbs = []
-        self.filtered_plants = []
-        self.selected_plant_item = None  # Clear selection when filtering
-        
-        # Add only plants matching the search query
-        for idx, p in enumerate(self.plants):
-            if query == "" or query in p["name"].lower():
-                img_path = p.get("image")
-                photo = None
-                
-                # Try to load plant's custom image
-                if img_path and os.path.exists(img_path):
-                    try:
-                        img = Image.open(img_path).resize((40, 40), Image.LANCZOS)
-                        photo = ImageTk.PhotoImage(img)
-                    except:
-                        photo = None  # Fallback if image fails to load
-                
-                # Use default icon if no custom image available
-                if photo is None and self.icon_default is not None:
-                    photo = self.icon_default
-                
-                self.plant_thumbs.append(photo)
-                
-                if photo is not None:
-                    item_id = self.plant_tree.insert("", "end", text=p["name"], image=photo)
-                else:
-                    item_id = self.plant_tree.insert("", "end", text=p["name"])
-                
-                self.tree_items.append(item_id)
-                self.filtered_plants.append(idx)
+        """Filter and display plants based on search query (name, sun:level, due:status)"""
+        query = self.search_var.get()
+        matches = self.plants.search(query)
+
+        # A new query starts at the top, data changes keep the scroll position
+        reset = query != self.last_query
+        if reset:
+            self.anchor = None
+            if self.selection:
+                # Bulk actions only apply to what the user can see in the results
+                shown = {plant.id for plant in matches}
+                self._select({pid: p for pid, p in self.selection.items() if pid in shown})
+        self.plant_list.set_plants(matches, reset=reset)
+        self.last_query = query
+
+    def _render_row(self, iid, plant):
+        """Draw a row that was just inserted, recycled for another plant, or changed"""
+        if iid in self.selection:
+            tags = ("selected",)
+        elif iid == self.last_hovered_item:
+            tags = ("hover",)  # The pointer is still over this row after a scroll
+        else:
+            tags = ()
+        self.plant_tree.item(iid, tags=tags)
+        self._load_row_image(iid, plant)
+
+    def _load_row_image(self, iid, plant):
+        """Show the cached thumbnail for a row, or the default icon until its decode finishes"""
+        photo = None
+        self.pending_thumbs.pop(iid, None)
+        if plant.image:
+            photo = self.images.request(
+                plant.image, (40, 40),
+                lambda photo, iid=iid, plant=plant: self._set_row_image(iid, plant, photo)
+            )
+            if photo is None:
+                self.pending_thumbs[iid] = plant
+        if photo is None:
+            photo = self.icon_default
+        self.plant_thumbs[iid] = photo  # Keep a reference so Tk does not drop the image
+        self.plant_tree.item(iid, image=photo if photo is not None else "")
+
+    def _set_row_image(self, iid, plant, photo):
+        """Swap a decoded thumbnail into a row that still shows its plant"""
+        if self.plant_list.rows.plant_for(iid) is plant:
+            self.pending_thumbs.pop(iid, None)
+            self.plant_thumbs[iid] = photo
+            self.plant_tree.item(iid, image=photo)
+
+    def _load_pending_thumbs(self):
+        """Drop thumbnail decodes queued for rows that scrolled or filtered away"""
+        self.images.cancel_all()
+        rows = self.plant_list.rows
+        if len(self.plant_thumbs) > len(rows.plants):
+            self.plant_thumbs = {iid: photo for iid, photo in self.plant_thumbs.items() if iid in rows.plants}
+        for iid, plant in list(self.pending_thumbs.items()):
+            if rows.plant_for(iid) is plant:
+                self._load_row_image(iid, plant)
+            else:
+                del self.pending_thumbs[iid]
+
+    @TRACE.traced("select")
+    def _select(self, selection):
+        """Replace the selection (plant ID -> plant) and redraw the highlighted rows on screen"""
+        self.selection = selection
+        if self.selected_plant is not None and self.selected_plant.id not in selection:
+            self.selected_plant = next(reversed(selection.values()), None)
+        for iid in self.plant_list.rows.order:
+            if iid in selection:
+                tags = ("selected",)
+            elif iid == self.last_hovered_item:
+                tags = ("hover",)
+            else:
+                tags = ()
+            self.plant_tree.item(iid, tags=tags)
+        self.selection_var.set(f"{plant_count(len(selection))} selected" if len(selection) > 1 else "")
+
+    def _selected_plants(self):
+        """Selected plants that still exist, in the order they were picked"""
+        return [plant for plant in self.selection.values() if plant in self.plants]
     
+    @TRACE.traced("hover")
     def _on_treeview_hover(self, event):
-        """Handle treeview hover effects"""
+        """Move the hover highlight when the pointer enters another row"""
         item = self.plant_tree.identify("item", event.x, event.y)
         if item != self.last_hovered_item:
-            if self.last_hovered_item and self.last_hovered_item != self.selected_plant_item:
+            selected = self.selection
+            if (self.last_hovered_item and self.last_hovered_item not in selected
+                    and self.plant_tree.exists(self.last_hovered_item)):
                 self.plant_tree.item(self.last_hovered_item, tags=())
-            if item and item != self.selected_plant_item:
+            if item and item not in selected:
                 self.plant_tree.item(item, tags=("hover",))
-                self.plant_tree.tag_configure("hover", background="#2E7D32")
             self.last_hovered_item = item
     
     def _on_treeview_leave(self, event):
         """Remove hover effect when leaving treeview"""
-        if self.last_hovered_item and self.last_hovered_item != self.selected_plant_item:
-            self.plant_tree.item(self.last_hovered_item, tags=())
+        if self.last_hovered_item and self.last_hovered_item not in self.selection:
+            if self.plant_tree.exists(self.last_hovered_item):
+                self.plant_tree.item(self.last_hovered_item, tags=())
             self.last_hovered_item = None
     
+    @TRACE.traced("click")
     def _on_treeview_click(self, event):
-        """Handle plant selection with dark yellow highlight"""
+        """Select a plant in dark yellow; Ctrl-click toggles one more, Shift-click selects a range"""
         item = self.plant_tree.identify("item", event.x, event.y)
-        
-        # Remove highlight from previously selected item
-        if self.selected_plant_item and self.selected_plant_item != item:
-            self.plant_tree.item(self.selected_plant_item, tags=())
-        
-        # Highlight clicked item in dark yellow
-        if item:
-            self.plant_tree.item(item, tags=("selected",))
-            self.plant_tree.tag_configure("selected", background="#B8860B")
-            self.selected_plant_item = item
+        if not item:
+            return
+        plant = self.plant_list.rows.plant_for(item)
+        index = self.plant_list.top + self.plant_tree.index(item)  # Position in the full result list
+
+        if event.state & 0x0001 and self.anchor is not None:  # Shift
+            start, end = sorted((self.anchor, index))
+            selection = {p.id: p for p in self.plant_list.plants[start:end + 1]}
+        elif event.state & 0x0004:  # Control
+            selection = dict(self.selection)
+            if selection.pop(plant.id, None) is None:
+                selection[plant.id] = plant
+            self.anchor = index
+        else:
+            selection = {plant.id: plant}
+            self.anchor = index
+        if plant.id in selection:
+            self.selected_plant = plant
+        self._select(selection)
 
     # ---------- ADD PLANT ----------
     def add_plant_window(self):
-        win = tk.Toplevel(self.root)
+        theme = self.theme
+        win = theme.add(tk.Toplevel(self.root), "panel")
         win.title("Add Plant")
         win.configure(bg=THEME["bg_panel"])
 
         def label(text, row):
-            tk.Label(win, text=text, bg=THEME["bg_panel"], fg=THEME["text"]).grid(
+            theme.add(tk.Label(win, text=text, bg=THEME["bg_panel"], fg=THEME["text"]), "panel_label").grid(
                 row=row, column=0, pady=5, padx=5, sticky="e"
             )
 
         label("Plant Name:", 0)
-        name_entry = tk.Entry(win, bg=THEME["entry_bg"], fg=THEME["entry_fg"],
-                              insertbackground=THEME["entry_fg"])
+        name_entry = theme.add(tk.Entry(win, bg=THEME["entry_bg"], fg=THEME["entry_fg"],
+                                        insertbackground=THEME["entry_fg"]), "entry")
         name_entry.grid(row=0, column=1, pady=5, padx=5)
 
         label("Water Every (days):", 1)
-        water_entry = tk.Entry(win, bg=THEME["entry_bg"], fg=THEME["entry_fg"],
-                               insertbackground=THEME["entry_fg"])
+        water_entry = theme.add(tk.Entry(win, bg=THEME["entry_bg"], fg=THEME["entry_fg"],
+                                         insertbackground=THEME["entry_fg"]), "entry")
         water_entry.grid(row=1, column=1, pady=5, padx=5)
 
         label("Sunlight Level:", 2)
@@ -441,12 +1420,14 @@ class MyPlantPal:
         sun_menu.configure(bg=THEME["btn"], fg=THEME["btn_text"],
                           activebackground=THEME["btn_hover"],
                           activeforeground=THEME["btn_text"])
+        theme.add(sun_menu, "menu")
         sun_menu.grid(row=2, column=1, pady=5, padx=5, sticky="w")
 
         label("Image (optional):", 3)
         img_path_var = tk.StringVar()
-        tk.Entry(win, textvariable=img_path_var, bg=THEME["entry_bg"],
-                fg=THEME["entry_fg"], insertbackground=THEME["entry_fg"]).grid(row=3, column=1, pady=5, padx=5)
+        theme.add(tk.Entry(win, textvariable=img_path_var, bg=THEME["entry_bg"],
+                           fg=THEME["entry_fg"], insertbackground=THEME["entry_fg"]),
+                  "entry").grid(row=3, column=1, pady=5, padx=5)
 
         def browse_img():
             path = filedialog.askopenfilename(filetypes=[("Images", "*.png;*.jpg;*.jpeg")])
@@ -471,109 +1452,262 @@ class MyPlantPal:
                 self.show_toast("Watering frequency must be a number.")
                 return
 
+            # Pre-generate thumbnails so the list never has to decode the original
+            if img:
+                self.images.prefetch(img)
+
             # Add new plant to database with metadata
-            self.plants.append({
-                "name": name,
-                "water": int(water),
-                "sun": sun,
-                "image": img,
-                "last_watered": datetime.now().strftime("%Y-%m-%d")  # Initialize with today's date
-            })
+            self.plants.add(Plant(name, int(water), Sun.parse(sun), img))  # Last watered today
             self.update_list()
-            self.build_dashboard()
-            self.show_toast(f"{name} added successfully!")
+            self.show_toast(f"{name} added successfully!", key="added", summary="{count} plants added")
             win.destroy()
 
         self._create_button(win, "Save Plant", save).grid(row=4, column=0, columnspan=3, pady=10)
 
     # ---------- DETAILS ----------
     def show_details(self):
-        if not hasattr(self, "plant_tree"):
-            return
-        selected = self.plant_tree.selection()
-        if not selected:
+        plant = self.selected_plant
+        if plant is None:
             self.show_toast("Pick a plant first.")
             return
 
-        index = self.tree_items.index(selected[0])
-        plant = self.plants[self.filtered_plants[index]]
-
-        win = tk.Toplevel(self.root)
+        win = self.theme.add(tk.Toplevel(self.root), "panel")
         win.title("Plant Details")
         win.configure(bg=THEME["bg_panel"])
 
         def detail(text):
-            tk.Label(win, text=text, bg=THEME["bg_panel"], fg=THEME["text"]).pack(pady=5)
-
-        detail(f"Name: {plant['name']}")
-        detail(f"Water Every: {plant['water']} days")
-        detail(f"Sunlight: {plant['sun']}")
-        detail(f"Last Watered: {plant['last_watered']}")
-
-        if plant["image"] and os.path.exists(plant["image"]):
-            img = Image.open(plant["image"]).resize((200, 200), Image.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
-            img_label = tk.Label(win, image=photo, bg=THEME["bg_panel"])
-            img_label.image = photo
+            self.theme.add(tk.Label(win, text=text, bg=THEME["bg_panel"], fg=THEME["text"]), "panel_label").pack(pady=5)
+
+        detail(f"Name: {plant.name}")
+        detail(f"Water Every: {plant.water} days")
+        detail(f"Sunlight: {plant.sun.label}")
+        detail(f"Last Watered: {plant.last_watered_text}")
+
+        stats = self.history.stats_for(plant.id)
+        if stats is not None:
+            detail(f"Watered {stats.count} times, every {stats.average_interval:.1f} days on average")
+            detail(f"Late: {stats.late} | On-time streak: {stats.streak} (best {stats.best_streak})")
+
+        if plant.image:
+            img_label = self.theme.add(tk.Label(win, bg=THEME["bg_panel"]), "panel")
             img_label.pack(pady=10)
 
+            def show_image(photo):
+                if img_label.winfo_exists():
+                    img_label.configure(image=photo)
+                    img_label.image = photo
+
+            photo = self.images.request(plant.image, (200, 200), show_image)
+            if photo is not None:
+                show_image(photo)
+
         def mark_as_watered():
-            plant["last_watered"] = datetime.now().strftime("%Y-%m-%d")
-            self.show_toast(f"{plant['name']} marked as watered!")
             win.destroy()
-            self.update_list()
-            self.build_dashboard()
+            self._water([plant])
 
         self._create_button(win, "Mark as Watered", mark_as_watered, self.icon_water).pack(pady=5)
         self._create_button(win, "Close", win.destroy).pack(pady=10)
 
+    # ---------- BULK ACTIONS ----------
+    def water_selected(self):
+        plants = self._selected_plants()
+        if not plants:
+            self.show_toast("Select plants to water.")
+            return
+        self._water(plants)
+
+    def _water(self, plants):
+        """Mark plants watered today as one change, logging each watering"""
+        plants = [plant for plant in plants if plant in self.plants]  # Deleted while a window was open
+        if not plants:
+            return
+        record_watering(self.plants, self.history, plants)
+        self.update_list()
+        name = plants[0].name if len(plants) == 1 else plant_count(len(plants))
+        self.show_toast(f"{name} marked as watered!", key="watered",
+                        summary="{count} plants marked as watered", count=len(plants))
+
+    def edit_selected_window(self):
+        """Change the watering interval and/or sunlight of every selected plant at once"""
+        plants = self._selected_plants()
+        if not plants:
+            self.show_toast("Select plants to edit.")
+            return
+
+        theme = self.theme
+        win = theme.add(tk.Toplevel(self.root), "panel")
+        win.title(f"Edit {plant_count(len(plants))}")
+        win.configure(bg=THEME["bg_panel"])
+
+        def label(text, row):
+            theme.add(tk.Label(win, text=text, bg=THEME["bg_panel"], fg=THEME["text"]), "panel_label").grid(
+                row=row, column=0, pady=5, padx=5, sticky="e"
+            )
+
+        label("Water Every (days):", 0)
+        water_entry = theme.add(tk.Entry(win, bg=THEME["entry_bg"], fg=THEME["entry_fg"],
+                                         insertbackground=THEME["entry_fg"]), "entry")
+        water_entry.grid(row=0, column=1, pady=5, padx=5)
+
+        label("Sunlight Level:", 1)
+        sunlight_var = tk.StringVar(value="Unchanged")
+        sun_menu = tk.OptionMenu(win, sunlight_var, "Unchanged", "Low", "Medium", "High")
+        sun_menu.configure(bg=THEME["btn"], fg=THEME["btn_text"],
+                           activebackground=THEME["btn_hover"],
+                           activeforeground=THEME["btn_text"])
+        theme.add(sun_menu, "menu")
+        sun_menu.grid(row=1, column=1, pady=5, padx=5, sticky="w")
+
+        def apply():
+            changes = {}
+            water = water_entry.get().strip()
+            if water:  # Left empty keeps each plant's own interval
+                if not water.isdigit():
+                    self.show_toast("Watering frequency must be a number.")
+                    return
+                changes["water"] = int(water)
+            if sunlight_var.get() != "Unchanged":
+                changes["sun"] = Sun.parse(sunlight_var.get())
+            win.destroy()
+            targets = [plant for plant in plants if plant in self.plants]  # Some may be deleted by now
+            if changes and targets:
+                self.plants.update(*targets, **changes)
+                self.update_list()
+                self.show_toast(f"{plant_count(len(targets))} updated!")
+
+        self._create_button(win, "Apply", apply).grid(row=2, column=0, columnspan=2, pady=10)
+
     # ---------- DELETE ----------
     def delete_plant(self):
-        if not hasattr(self, "plant_tree"):
-            return
-        selected = self.plant_tree.selection()
-        if not selected:
+        plants = self._selected_plants()
+        if not plants:
             self.show_toast("Select a plant to delete.")
             return
-        index = self.tree_items.index(selected[0])
-        deleted_name = self.plants[self.filtered_plants[index]]["name"]
-        del self.plants[self.filtered_plants[index]]
+        if len(plants) > 1 and not messagebox.askyesno("Delete Plants", f"Delete {plant_count(len(plants))}?"):
+            return
+        self._select({})
+        self.plants.remove(*plants)
         self.update_list()
-        self.build_dashboard()
-        self.show_toast(f"{deleted_name} deleted!")
+        name = plants[0].name if len(plants) == 1 else plant_count(len(plants))
+        self.show_toast(f"{name} deleted!", key="deleted", summary="{count} plants deleted", count=len(plants))
 
     # ---------- SAVE / LOAD ----------
     def save_plants(self):
-        """Persist all plant data to JSON file for recovery on app restart"""
-        with open("plants.json", "w") as f:
-            json.dump(self.plants, f, indent=4)  # Pretty-print JSON for readability
-        self.show_toast("Plants saved successfully!")
+        """Write pending changes now instead of waiting for autosave"""
+        if self.storage.failed is not None:
+            self.show_toast(f"Not saved: loading plants failed ({self.storage.failed})")
+            return
+        self.storage.save(self.plants)  # Also retries after an autosave failure
+        self._report_save()
+
+    def _report_save(self):
+        """Toast the outcome of Save Plants once the background write has finished"""
+        if self.storage.saving:
+            self.root.after(SAVE_POLL_MS, self._report_save)
+        elif self.storage.error is not None:
+            self.show_toast(f"Save failed: {self.storage.error}")
+        else:
+            self.show_toast("Plants saved successfully!")
+
+    def export_plants(self):
+        """Save a pretty-printed copy of the plant list wherever the user picks"""
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        try:
+            self.storage.export(path)
+        except OSError as e:
+            self.show_toast(f"Export failed: {e}")
+            return
+        self.show_toast(f"Plants exported to {os.path.basename(path)}")
 
     def load_plants(self):
-        """Load plant data from JSON file at app startup"""
-        if os.path.exists("plants.json"):
-            with open("plants.json", "r") as f:
-                self.plants = json.load(f)  # Load plant list from persistent storage
+        """Start streaming plants from storage; batches are added from the event loop"""
+        self.plants = PlantCollection()
+        self.storage.attach(self.plants)  # Later changes are saved automatically
+        self.history.follow(self.plants)  # Deleted plants take their watering history with them
+        self.load_total = self.storage.count()  # Known up front when an index exists
+        self.loader = self.storage.iter_chunks()  # None once every plant is loaded
+        self.cached_stats = read_stats_cache()
+        if self.cached_stats is not None and self.cached_stats.get("total") != self.load_total:
+            self.cached_stats = None  # Plants were changed outside the app
+
+    @TRACE.traced("load.chunk")
+    def _load_next_chunk(self):
+        """Add one more batch of plants per event-loop turn until storage is exhausted"""
+        if self.loader is None:
+            return  # Finished early by on_close
+        try:
+            chunk = next(self.loader, None)
+        except Exception as e:  # A record that can't be read; the storage stops writing
+            chunk = None
+            self.show_toast(f"Could not load every plant ({e}). Changes won't be saved until the "
+                            "plant file is fixed.", duration=10000)
+        if chunk is None:
+            self.loader = None
+            self.root.title("My Plant Pal" if self.storage.failed is None else "My Plant Pal - read only")
+            self._schedule_dashboard()  # Replace the cached numbers with real ones
+            self.check_watering_reminders()
+            self.reminders = ReminderScheduler(self.root, self.plants, self.remind)
+            self.root.after(1, self._index_search)
+            if self.startup_times is not None:
+                self._mark_startup(f"plants loaded ({len(self.plants)})")
+                self._report_startup()
+            return
+        self.plants.extend(chunk, "loaded")
+        if self.load_total:
+            self.root.title(f"My Plant Pal - loading {len(self.plants) * 100 // self.load_total}%")
+        else:
+            self.root.title(f"My Plant Pal - loading {len(self.plants)} plants")
+        self.update_list()
+        self.root.after(1, self._load_next_chunk)
+
+    @TRACE.traced("search.index")
+    def _index_search(self):
+        """Trigram-index the loaded names a batch per event-loop turn; searches scan the rest meanwhile"""
+        if self.plants.search_index.index_pending():
+            self.root.after(1, self._index_search)
+
+    # ---------- STARTUP TIMING ----------
+    def _mark_startup(self, stage):
+        self.startup_times.append((stage, (time.perf_counter() - STARTUP_STARTED) * 1000))
+
+    def _first_frame(self, event):
+        self.root.unbind("<Expose>")
+        self._mark_startup("first frame")
+
+    def _report_startup(self):
+        """Print how long each startup stage took, then quit (--startup-time)"""
+        for stage, ms in self.startup_times:
+            print(f"{stage:<28}{ms:9.1f} ms")
+        print(f"{'Pillow imported':<28}{'yes' if 'PIL' in sys.modules else 'no':>9}")
+        self.on_close()
 
     # ---------- REMINDERS ----------
+    @TRACE.traced("reminders")
     def check_watering_reminders(self):
         """Check for plants that need watering and show alert"""
-        today = datetime.now().date()
-        reminders = []
-        for plant in self.plants:
-            last = datetime.strptime(plant["last_watered"], "%Y-%m-%d").date()
-            due = last + timedelta(days=plant["water"])  # Calculate when plant is due
-            if today >= due:  # If today is on or past the due date
-                reminders.append(plant["name"])
-        if reminders:
-            message = "Plants need water: " + ", ".join(reminders)
-            self.show_toast(message, duration=5000)  # Show longer notification for reminders
+        # Every plant on or past its due date, most overdue first
+        self.remind(self.plants.due_plants())
+
+    def remind(self, plants):
+        """Show one reminder toast for a group of plants that need water"""
+        self._schedule_dashboard()  # The date changed, so the counts did too
+        if not plants:
+            return
+        if len(plants) <= REMINDER_NAMES:
+            message = "Plants need water: " + ", ".join(plant.name for plant in plants)
+        else:
+            message = f"{len(plants)} plants need water"
+        # Show longer notification for reminders
+        self.show_toast(message, duration=5000, key="reminder", summary="{count} plants need water",
+                        count=len(plants))
 
     # ---------- UPDATE LIST ----------
     def update_list(self):
         """Refresh the plant list display with current search filter applied"""
-        # Guard against calling before treeview is initialized
-        if not hasattr(self, "plant_tree") or self.plant_tree is None:
+        # Nothing to refresh until the Plants page has been opened
+        if self.plant_tree is None:
             return
 
         # Reapply search filter to update displayed plants
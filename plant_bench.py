@@ -0,0 +1,391 @@
+"""
+My Plant Pal benchmarks - synthetic collections and timings for the paths that grow with them.
+
+    python plant_bench.py generate 100000 -o bench/plants.json --images 20
+    python plant_bench.py run --sizes 1000,10000,100000 -o results.json
+    python plant_bench.py run --baseline results.json
+
+Collections come from a fixed seed and reference day, so two runs time the
+same work. The plant list runs against stub widgets and nothing needs a
+display; a run exits with status 1 when it is slower than the baseline or
+the numpy and pure-Python statistics disagree.
+|================================================================================|
+Author: Victor Delgado | GitHub: https://github.com/VictorDelgadoJ-Ops/My-Plant-Pal
+"""
+
+import argparse, importlib.util, json, os, platform, random, statistics, sys, tempfile, time
+from datetime import date, datetime, timedelta, timezone
+from plant_core import (
+    FORECAST_DAYS, JsonStorage, Sun, index_path, np, write_plants_file
+)
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "My-Plant-Pal.py")
+
+# ---------- SYNTHETIC COLLECTIONS ----------
+BENCH_SEED = 2026
+BENCH_DAY = date(2026, 1, 1)  # "Today" for every generated collection and timed query
+BENCH_IMAGE_SIZE = (640, 480)
+PLANT_KINDS = (
+    "Aloe Vera", "Basil", "Begonia", "Boston Fern", "Calathea", "Fiddle Leaf Fig", "Jade",
+    "Lavender", "Monstera", "Orchid", "Peace Lily", "Peperomia", "Pothos", "Snake Plant",
+    "Spider Plant", "String of Pearls"
+)
+PLANT_SPOTS = ("Bench", "Kitchen", "Shelf", "Table", "Window", "Greenhouse")
+
+def generate_records(count, seed=BENCH_SEED, images=()):
+    """Yield count plants.json records; the same seed always yields the same records"""
+    rng = random.Random(seed)
+    suns = [sun.label for sun in Sun]
+    for n in range(count):
+        yield {
+            "id": f"{rng.getrandbits(64):016x}",
+            "name": f"{rng.choice(PLANT_KINDS)} {rng.choice(PLANT_SPOTS)} {n + 1}",
+            "water": rng.randint(1, 21),
+            "sun": rng.choice(suns),
+            "image": images[n % len(images)] if images else "",
+            "last_watered": (BENCH_DAY - timedelta(days=rng.randint(0, 30))).isoformat()
+        }
+
+def generate_images(directory, count, seed=BENCH_SEED):
+    """Write count distinct photo-sized JPEGs to directory and return their paths (needs Pillow)"""
+    from PIL import Image, ImageDraw
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for n in range(count):
+        path = os.path.join(directory, f"plant_{n + 1}.jpg")
+        img = Image.new("RGB", BENCH_IMAGE_SIZE, tuple(rng.randrange(256) for _ in range(3)))
+        draw = ImageDraw.Draw(img)
+        for _ in range(12):
+            x, y = rng.randrange(BENCH_IMAGE_SIZE[0]), rng.randrange(BENCH_IMAGE_SIZE[1])
+            r = rng.randint(20, 160)
+            draw.ellipse((x - r, y - r, x + r, y + r), fill=tuple(rng.randrange(256) for _ in range(3)))
+        img.save(path, "JPEG", quality=85)
+        paths.append(path)
+    return paths
+
+def generate_collection(path, count, seed=BENCH_SEED, images=()):
+    """Write a synthetic plants.json (and its offset index) to path"""
+    write_plants_file(path, generate_records(count, seed, images))
+
+# ---------- WIDGET STUBS ----------
+class StubTree:
+    """Just enough of a ttk.Treeview for VirtualPlantList, counting item edits"""
+
+    def __init__(self, height=720):
+        self.height = height
+        self.children = []
+        self.edits = 0
+
+    def insert(self, parent, index, iid=None, text=""):
+        self.children.insert(index, iid)
+        self.edits += 1
+        return iid
+
+    def delete(self, *iids):
+        self.detach(*iids)
+
+    def detach(self, *iids):
+        gone = set(iids)
+        self.children = [iid for iid in self.children if iid not in gone]
+        self.edits += len(iids)
+
+    def move(self, iid, parent, index):
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+        self.edits += 1
+
+    def item(self, iid, **options):
+        self.edits += 1
+
+    def bind(self, sequence, func):
+        pass
+
+    def winfo_height(self):
+        return self.height
+
+    def yview_moveto(self, fraction):
+        pass
+
+class StubScrollbar:
+    def configure(self, **options):
+        pass
+
+    def set(self, first, last):
+        pass
+
+def load_app():
+    """Import My-Plant-Pal.py as a module (no window is created), or None without tkinter"""
+    spec = importlib.util.spec_from_file_location("my_plant_pal", APP_FILE)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except ImportError:
+        return None
+    return module
+
+# ---------- TIMING ----------
+SEARCH_TYPED = ("monstera shelf", "sun:high fern")  # Typed one character at a time
+# Pasted whole; none contains the one before, so no search can narrow the previous result
+SEARCH_PASTED = ("fern", "ivy", "kitchen 12", "orchid", "lily window", "sun:low pot")
+
+def best_ms(func, repeat):
+    """Fastest of repeat calls of func in milliseconds, and the last call's result"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return round(best, 3), result
+
+def spread(samples):
+    """Median, 95th percentile and worst of a list of millisecond timings"""
+    ordered = sorted(samples)
+    return {
+        "median": round(statistics.median(ordered), 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max": round(ordered[-1], 3)
+    }
+
+def keystrokes():
+    """Every prefix of the typed searches, as the search box sees them"""
+    return [text[:i] for text in SEARCH_TYPED for i in range(1, len(text) + 1)]
+
+def time_queries(search, queries, repeat):
+    """Timings of search(query) for each query: the first pass (cold) and each query's best of repeat passes"""
+    first, best = [], [None] * len(queries)
+    for n in range(repeat):
+        for i, query in enumerate(queries):
+            started = time.perf_counter()
+            search(query)
+            elapsed = (time.perf_counter() - started) * 1000
+            if n == 0:
+                first.append(elapsed)
+            best[i] = elapsed if best[i] is None else min(best[i], elapsed)
+    return {"first": spread(first), "best": spread(best)}
+
+def summary_with(plants, today, vectorized, days=FORECAST_DAYS):
+    """PlantCollection.summary with every statistic forced onto one engine (numpy columns or due index)"""
+    overdue, due_today, healthy = plants.due_counts(today, vectorized=vectorized)
+    return {"total": len(plants), "today": due_today, "overdue": overdue, "healthy": healthy,
+            "forecast": plants.due_histogram(today, days, vectorized=vectorized)}
+
+# ---------- BENCHMARKS ----------
+def bench_collection(path, app, repeat):
+    """Timings for one generated plants.json, plus whether both stats paths agree"""
+    results = {}
+    def load():
+        plants = JsonStorage(path).load()
+        plants.next_due_after(0)  # The reminder check after loading sorts the due index; count it here
+        return plants
+    results["load_ms"], plants = best_ms(load, repeat)
+
+    # The same file without its offset index, as on a first start, after a hand edit or with a
+    # stale index: the streaming parser reads it
+    hidden = index_path(path) + ".off"
+    os.replace(index_path(path), hidden)
+    try:
+        results["load_stream_ms"], _ = best_ms(load, repeat)
+    finally:
+        os.replace(hidden, index_path(path))
+
+    # Searches right after loading, before the app has trigram-indexed any name
+    results["search_cold_ms"] = time_queries(plants.search, SEARCH_PASTED, 1)["first"]
+
+    # The app then indexes the names a batch per event-loop turn
+    steps = []
+    while True:
+        started = time.perf_counter()
+        more = plants.search_index.index_pending()
+        steps.append((time.perf_counter() - started) * 1000)
+        if not more:
+            break
+    results["search_index_ms"] = {"total": round(sum(steps), 3), "step": spread(steps)}
+
+    # filter_plants: the query goes through the search index, then the virtual list
+    results["search_keystroke_ms"] = time_queries(plants.search, keystrokes(), repeat)
+    results["search_pasted_ms"] = time_queries(plants.search, SEARCH_PASTED, repeat)
+    if app is not None:
+        tree = StubTree()
+        plant_list = app.VirtualPlantList(tree, StubScrollbar(), lambda iid, plant: tree.item(iid, tags=()))
+        def filter_plants(query):
+            plant_list.set_plants(plants.search(query), reset=True)
+        results["filter_keystroke_ms"] = time_queries(filter_plants, keystrokes(), repeat)
+        results["filter_pasted_ms"] = time_queries(filter_plants, SEARCH_PASTED, repeat)
+
+    # get_stats as the dashboard runs it, and with everything forced onto the numpy columns
+    results["stats_ms"], stats = best_ms(lambda: plants.summary(BENCH_DAY), repeat)
+    results["stats_numpy_ms"], vectorized = best_ms(lambda: summary_with(plants, BENCH_DAY, True), repeat)
+    results["stats_python_ms"], expected = best_ms(lambda: summary_with(plants, BENCH_DAY, False), repeat)
+    stats_match = stats == expected == vectorized
+
+    # check_watering_reminders plus the scheduler's next wake-up
+    def reminders():
+        due = plants.due_plants(today=BENCH_DAY)
+        plants.next_due_after(BENCH_DAY.toordinal())
+        return due
+    results["reminders_ms"], due = best_ms(reminders, repeat)
+    results["due_plants"] = len(due)
+
+    # save_plants: what the autosave thread writes
+    target = path + ".saved"
+    results["save_ms"], _ = best_ms(lambda: write_plants_file(target, plants.to_json()), repeat)
+    for leftover in (target, target + ".idx"):
+        os.remove(leftover)
+    return results, stats_match
+
+def bench_thumbnails(app, images, directory):
+    """Derivative generation for every image from scratch, then the next startup's lookups"""
+    store = app.ThumbnailStore(directory)
+    def generate():
+        for path in images:
+            store.generate(path)
+        store.flush()
+    cold, _ = best_ms(generate, 1)
+    store = app.ThumbnailStore(directory)  # Rereads the manifest like a fresh start
+    size = app.THUMB_SIZES[0]
+    warm, _ = best_ms(lambda: [store.ensure(path, size) for path in images], 3)
+    return {"images": len(images), "cold_ms": cold, "warm_ms": warm}
+
+def run_benchmarks(sizes, repeat=3, image_count=0, workdir=None, seed=BENCH_SEED):
+    """Generate a collection of each size and time it; returns the JSON-ready report"""
+    app = load_app()
+    report = {
+        "meta": {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__ if np is not None else None,
+            "widgets": "stub" if app is not None else None,
+            "seed": seed,
+            "repeat": repeat
+        },
+        "results": {},
+        "checks": {"stats_match": True}
+    }
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        images = ()
+        if image_count:
+            try:
+                images = generate_images(os.path.join(tmp, "images"), image_count, seed)
+            except ImportError:
+                print("Pillow is not installed, skipping images and thumbnails", file=sys.stderr)
+        for size in sizes:
+            path = os.path.join(tmp, f"plants_{size}.json")
+            generate_collection(path, size, seed, images)
+            print(f"Timing {size} plants...", file=sys.stderr)
+            results, stats_match = bench_collection(path, app, repeat)
+            report["results"][str(size)] = results
+            report["checks"]["stats_match"] = report["checks"]["stats_match"] and stats_match
+            os.remove(path)
+            os.remove(path + ".idx")
+        if images and app is not None:
+            report["results"]["thumbnails"] = bench_thumbnails(app, images, os.path.join(tmp, "thumbnails"))
+    return report
+
+# ---------- BASELINE ----------
+REGRESSION_TOLERANCE = 0.25  # Slower than baseline by more than this fraction is a regression
+REGRESSION_MIN_MS = 1.0  # ...and by at least this much, so sub-millisecond noise is ignored
+
+def timings(results, prefix=""):
+    """Flatten nested results into {"1000.load_ms": value, "1000.search_keystroke_ms.p95": ...}"""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(timings(value, name + "."))
+        elif "_ms" in name and isinstance(value, (int, float)):
+            flat[name] = value
+    return flat
+
+def compare(report, baseline, tolerance=REGRESSION_TOLERANCE, min_ms=REGRESSION_MIN_MS):
+    """Timings in report slower than the same timings in baseline, worst first"""
+    current, before = timings(report["results"]), timings(baseline.get("results", {}))
+    regressions = []
+    for name, value in current.items():
+        old = before.get(name)
+        if old is not None and value > old * (1 + tolerance) and value - old >= min_ms:
+            regressions.append({"metric": name, "baseline": old, "current": value,
+                                "ratio": round(value / old, 2) if old else None})
+    regressions.sort(key=lambda r: r["ratio"] or float("inf"), reverse=True)
+    return regressions
+
+# ---------- COMMANDS ----------
+def parse_sizes(text):
+    """argparse type for a comma-separated list of collection sizes"""
+    try:
+        sizes = [int(part) for part in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a list of sizes: {text!r}") from None
+    if any(size < 1 for size in sizes):
+        raise argparse.ArgumentTypeError("sizes must be positive")
+    return sizes
+
+def cmd_generate(args):
+    """Write one synthetic plants.json, optionally with image files beside it"""
+    images = ()
+    if args.images:
+        directory = os.path.join(os.path.dirname(os.path.abspath(args.output)), "bench_images")
+        images = generate_images(directory, args.images, args.seed)
+    generate_collection(args.output, args.count, args.seed, images)
+    print(f"Wrote {args.count} plants to {args.output}" + (f" ({len(images)} images)" if images else ""))
+
+def cmd_run(args):
+    """Time every benchmark, write the JSON report and compare it with a baseline"""
+    report = run_benchmarks(args.sizes, args.repeat, args.images, args.workdir, args.seed)
+    failed = not report["checks"]["stats_match"]
+    if failed:
+        print("numpy and pure-Python statistics disagree", file=sys.stderr)
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+        report["regressions"] = regressions
+        for r in regressions:
+            print(f"Regression: {r['metric']} {r['baseline']} ms -> {r['current']} ms", file=sys.stderr)
+        failed = failed or bool(regressions)
+
+    text = json.dumps(report, indent=2)
+    if args.output in (None, "-"):
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    return 1 if failed else 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="plant_bench.py", description="Benchmark My Plant Pal on synthetic collections")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("generate", help="write a synthetic plants.json")
+    p.add_argument("count", type=int, help="number of plants")
+    p.add_argument("-o", "--output", default="plants.json", help="where to write it (default: plants.json)")
+    p.add_argument("--images", type=int, default=0, metavar="N", help="also write N image files for the plants to share")
+    p.add_argument("--seed", type=int, default=BENCH_SEED)
+    p.set_defaults(func=cmd_generate)
+
+    p = sub.add_parser("run", help="time load, search, stats, reminders, save and thumbnails")
+    p.add_argument("--sizes", type=parse_sizes, default=[1000, 10000, 100000],
+                   help="comma-separated collection sizes (default: 1000,10000,100000)")
+    p.add_argument("--repeat", type=int, default=3, help="runs per timing, the fastest is kept (default: 3)")
+    p.add_argument("--images", type=int, default=0, metavar="N", help="give the plants N image files and time thumbnails")
+    p.add_argument("--seed", type=int, default=BENCH_SEED)
+    p.add_argument("--workdir", help="where to put the generated files (default: system temp directory)")
+    p.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    p.add_argument("--baseline", help="earlier report to compare against; slower timings exit with status 1")
+    p.add_argument("--tolerance", type=float, default=REGRESSION_TOLERANCE,
+                   help=f"allowed slowdown before flagging a regression (default: {REGRESSION_TOLERANCE})")
+    p.set_defaults(func=cmd_run)
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args) or 0
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+My Plant Pal CLI - bulk import, watering schedules and bulk watering without a display.
+
+    python plant_cli.py import plants.csv
+    python plant_cli.py schedule --days 14 --format ics -o waterings.ics
+    python plant_cli.py water "fern due:overdue"
+    python plant_cli.py stats
+
+Set PLANTPAL_STORAGE=sqlite (or pass --storage sqlite) to work on plants.db.
+|================================================================================|
+Author: Victor Delgado | GitHub: https://github.com/VictorDelgadoJ-Ops/My-Plant-Pal
+"""
+
+import argparse, os, sys, time
+from datetime import date
+from plant_core import (
+    FORECAST_DAYS, PlantCollection, SqliteStorage, WateringLog, open_storage, read_csv_plants,
+    read_json_plants, record_watering, write_schedule_csv, write_schedule_ics
+)
+
+def parse_day(text):
+    """argparse type for ISO dates, returned as ordinals"""
+    try:
+        return date.fromisoformat(text).toordinal()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a YYYY-MM-DD date: {text!r}") from None
+
+# ---------- COMMANDS ----------
+def cmd_import(args):
+    """Add every plant in a CSV or JSON file as one change"""
+    fmt = args.format or ("csv" if args.file.lower().endswith(".csv") else "json")
+    reader = read_csv_plants if fmt == "csv" else read_json_plants
+    started = time.perf_counter()
+    with open(args.file, "r", newline="", encoding="utf-8") as f:
+        # Parse everything first so a bad row leaves the collection untouched
+        new = [plant for chunk in reader(f) for plant in chunk]
+    parsed = time.perf_counter()
+
+    storage = open_storage(args.storage)
+    try:
+        if isinstance(storage, SqliteStorage):
+            storage.insert(new)  # Appends rows; the stored plants are never read
+            total = storage.count()
+        else:
+            plants = storage.load()
+            storage.attach(plants)
+            plants.extend(new)
+            total = len(plants)
+    finally:
+        storage.close()  # Writes the file (or commits) before returning
+    elapsed = parsed - started
+    rate = len(new) / elapsed if elapsed else 0
+    print(f"Imported {len(new)} plants ({rate:,.0f} rows/s parsed, {total} total)")
+
+def cmd_schedule(args):
+    """Stream the watering schedule for the coming days as CSV or iCalendar"""
+    storage = open_storage(args.storage)
+    plants = storage.load()
+    storage.close()
+    start = args.start or date.today().toordinal()
+    write = write_schedule_ics if args.format == "ics" else write_schedule_csv
+    if args.output in (None, "-"):
+        count = write(sys.stdout, plants, start, args.days)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            count = write(f, plants, start, args.days)
+    print(f"{count} {'events' if args.format == 'ics' else 'waterings'} over {args.days} days", file=sys.stderr)
+
+def cmd_water(args):
+    """Mark every plant matching a search query as watered"""
+    if not args.query.strip():
+        raise ValueError("refusing to water every plant; give a query such as 'due:overdue'")
+    storage = open_storage(args.storage)
+    if isinstance(storage, SqliteStorage):
+        # Only the matching rows are read; the changes are written back by plant ID
+        matches = storage.search(args.query)
+        plants = PlantCollection(matches)
+    else:
+        plants = storage.load()
+        matches = plants.search(args.query)
+    if args.dry_run:
+        for plant in matches:
+            print(plant.name)
+        storage.close()
+        return
+    storage.attach(plants)
+    history = WateringLog()
+    try:
+        record_watering(plants, history, matches, args.date)
+    finally:
+        history.close()
+        storage.close()
+    print(f"Watered {len(matches)} plants")
+
+def cmd_stats(args):
+    """Print the dashboard numbers"""
+    storage = open_storage(args.storage)
+    try:
+        if isinstance(storage, SqliteStorage):
+            stats = storage.summary(days=args.days)  # Counted by the database, nothing is loaded
+        else:
+            stats = storage.load().summary(days=args.days)
+    finally:
+        storage.close()
+    print(f"Total plants:      {stats['total']}")
+    print(f"Need water today:  {stats['today']}")
+    print(f"Overdue:           {stats['overdue']}")
+    print(f"Healthy:           {stats['healthy']}")
+    print(f"Due in the next {args.days} days: {sum(stats['forecast'])}")
+
+# ---------- ARGUMENTS ----------
+def build_parser():
+    parser = argparse.ArgumentParser(prog="plant_cli.py", description="My Plant Pal from the command line")
+    parser.add_argument("--storage", choices=("json", "sqlite"),
+                        help="storage backend (default: $PLANTPAL_STORAGE or json)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    sub = commands.add_parser("import", help="bulk-add plants from a CSV or JSON file")
+    sub.add_argument("file")
+    sub.add_argument("--format", choices=("csv", "json"), help="default: guessed from the file extension")
+    sub.set_defaults(run=cmd_import)
+
+    sub = commands.add_parser("schedule", help="export upcoming waterings")
+    sub.add_argument("--days", type=int, default=FORECAST_DAYS)
+    sub.add_argument("--start", type=parse_day, help="first day (default: today)")
+    sub.add_argument("--format", choices=("csv", "ics"), default="csv")
+    sub.add_argument("-o", "--output", help="file to write (default: standard output)")
+    sub.set_defaults(run=cmd_schedule)
+
+    sub = commands.add_parser("water", help="mark plants matching a search query as watered")
+    sub.add_argument("query", help='search text, e.g. "fern sun:low due:overdue"')
+    sub.add_argument("--date", type=parse_day, help="day they were watered (default: today)")
+    sub.add_argument("--dry-run", action="store_true", help="list the matching plants without changing them")
+    sub.set_defaults(run=cmd_water)
+
+    sub = commands.add_parser("stats", help="print plant health counts")
+    sub.add_argument("--days", type=int, default=FORECAST_DAYS, help="forecast length")
+    sub.set_defaults(run=cmd_stats)
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "days", 1) < 1:
+        parser.error("--days must be at least 1")
+    try:
+        args.run(args)
+    except BrokenPipeError:
+        # Output was piped into something like head that stopped reading
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"{parser.prog}: error: {e}\n")
+
+if __name__ == "__main__":
+    main()
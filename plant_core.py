@@ -0,0 +1,1370 @@
+"""
+My Plant Pal core - plants, due dates, search, storage and watering history.
+
+Everything here runs without a display; the Tk app and plant_cli.py are both
+clients of it.
+|================================================================================|
+Author: Victor Delgado | GitHub: https://github.com/VictorDelgadoJ-Ops/My-Plant-Pal
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Statistics fall back to the pure-Python due-date index
+import csv, json, os, bisect, heapq, itertools, sqlite3, struct, threading, time
+from array import array
+from datetime import date, datetime, timezone
+from enum import IntEnum
+from plant_trace import TRACE
+
+# ---------- PLANT MODEL ----------
+class Sun(IntEnum):
+    """Sunlight level, stored in plants.json by its label"""
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+    @property
+    def label(self):
+        return self.name.capitalize()
+
+    @classmethod
+    def parse(cls, text):
+        """Sun level for a label such as "High" (case-insensitive)"""
+        try:
+            return cls[text.strip().upper()]
+        except KeyError:
+            raise ValueError(f"Unknown sunlight level: {text!r}") from None
+
+def new_plant_id():
+    """Random 64-bit ID in hex; unique enough for any collection and stable across saves"""
+    return os.urandom(8).hex()
+
+class Plant:
+    """One plant record; dates are day ordinals and sunlight a Sun level"""
+    __slots__ = ("id", "name", "water", "sun", "image", "last_watered", "extra")
+
+    # Keys written to plants.json, in file order
+    FIELDS = ("id", "name", "water", "sun", "image", "last_watered")
+
+    def __init__(self, name, water, sun, image="", last_watered=None, extra=None, plant_id=None):
+        self.id = plant_id or new_plant_id()  # Persistent; also the plant's Treeview iid
+        self.name = name
+        self.water = water  # Watering interval in days
+        self.sun = sun
+        self.image = image
+        self.last_watered = date.today().toordinal() if last_watered is None else last_watered
+        self.extra = extra  # Unknown keys from plants.json, kept so saving round-trips
+
+    @property
+    def next_due(self):
+        """Ordinal of the day the plant is next due: last watered + watering interval"""
+        return self.last_watered + self.water
+
+    @property
+    def last_watered_text(self):
+        return date.fromordinal(self.last_watered).isoformat()
+
+    @classmethod
+    def from_json(cls, record):
+        extra = {k: v for k, v in record.items() if k not in cls.FIELDS}
+        try:
+            sun = Sun.parse(record["sun"])
+        except (AttributeError, ValueError):
+            # A hand-edited label such as "Full" loads as Medium; the text is saved back as written
+            sun = Sun.MEDIUM
+            extra["sun"] = record["sun"]
+        return cls(
+            record["name"], record["water"], sun, record["image"],
+            date.fromisoformat(record["last_watered"]).toordinal(), extra or None, record.get("id")
+        )
+
+    def to_json(self):
+        record = {
+            "id": self.id,
+            "name": self.name,
+            "water": self.water,
+            "sun": self.sun.label,
+            "image": self.image,
+            "last_watered": self.last_watered_text
+        }
+        if self.extra:
+            record.update(self.extra)
+        return record
+
+# ---------- DUE DATES ----------
+DUE_BATCH = 64  # Changes to more plants than this re-sort the index in one pass
+
+class DueIndex:
+    """Plants kept sorted by next due date so health counts are binary searches.
+
+    Entries are (due ordinal, sequence number) pairs; dates are only parsed when
+    a plant is added or watered, never when counting. Bulk additions wait in a
+    pending list and are sorted in on the next query, so loading in batches
+    sorts once instead of once per batch.
+    """
+
+    def __init__(self, plants=()):
+        self._sorted = []  # Sorted (due ordinal, sequence number)
+        self._pending = []  # Entries from extend() not yet sorted in
+        self._keys = {}  # plant ID -> its entry
+        self._plants = {}  # sequence number -> plant
+        self._next = 0
+        self.extend(plants)
+
+    def __len__(self):
+        return len(self._sorted) + len(self._pending)
+
+    @property
+    def _entries(self):
+        if self._pending:
+            self._sorted.extend(self._pending)
+            self._sorted.sort()  # Two sorted runs: a linear merge
+            self._pending = []
+        return self._sorted
+
+    def _entry(self, plant):
+        entry = (plant.next_due, self._next)
+        self._next += 1
+        self._keys[plant.id] = entry
+        self._plants[entry[1]] = plant
+        return entry
+
+    def add(self, plant):
+        bisect.insort(self._entries, self._entry(plant))
+
+    def extend(self, plants):
+        """Add many plants, sorted in on the next query"""
+        self._pending.extend(self._entry(plant) for plant in plants)
+
+    def remove(self, *plants):
+        entries = [self._keys.pop(plant.id) for plant in plants]
+        for entry in entries:
+            del self._plants[entry[1]]
+        if len(entries) > DUE_BATCH:
+            drop = set(entries)  # One filtering pass instead of many list deletions
+            self._sorted = [entry for entry in self._entries if entry not in drop]
+        else:
+            for entry in entries:
+                del self._entries[bisect.bisect_left(self._entries, entry)]
+
+    def update(self, *plants):
+        """Re-sort plants after they were watered or their interval changed"""
+        self.remove(*plants)
+        if len(plants) > DUE_BATCH:
+            self.extend(plants)
+        else:
+            for plant in plants:
+                self.add(plant)
+
+    def counts(self, today=None):
+        """Return (overdue, due today, healthy) counts against today"""
+        today = (today or date.today()).toordinal()
+        first_today = bisect.bisect_left(self._entries, (today,))
+        first_later = bisect.bisect_left(self._entries, (today + 1,))
+        return first_today, first_later - first_today, len(self._entries) - first_later
+
+    def histogram(self, start, days):
+        """Number of plants next due on each of the days from start (an ordinal)"""
+        entries = self._entries
+        edges = [bisect.bisect_left(entries, (start + i,)) for i in range(days + 1)]
+        return [edges[i + 1] - edges[i] for i in range(days)]
+
+    def due_plants(self, today=None, after=None):
+        """Plants due today or overdue, most overdue first; only those due after `after` if given"""
+        today = (today or date.today()).toordinal()
+        start = 0 if after is None else bisect.bisect_left(self._entries, (after + 1,))
+        end = bisect.bisect_left(self._entries, (today + 1,))
+        plants = self._plants
+        return [plants[seq] for _, seq in self._entries[start:end]]
+
+    def next_due_after(self, day):
+        """Earliest due ordinal later than day, or None when nothing is due after it"""
+        i = bisect.bisect_left(self._entries, (day + 1,))
+        return self._entries[i][0] if i < len(self._entries) else None
+
+# ---------- COLUMNAR STATISTICS ----------
+class PlantColumns:
+    """The collection mirrored into NumPy arrays for whole-collection statistics over long ranges.
+
+    Rows are unordered: deleting swaps the last row into the hole, so every
+    update is O(1) and every statistic is a single vectorized pass.
+    """
+
+    def __init__(self, plants=()):
+        plants = list(plants)
+        size = len(plants)
+        self.last_watered = np.fromiter((p.last_watered for p in plants), np.int32, size)
+        self.water = np.fromiter((p.water for p in plants), np.int32, size)
+        self._grow(max(size, 64))
+        self._plants = plants  # row -> plant
+        self._rows = {p.id: row for row, p in enumerate(plants)}  # plant ID -> row
+        self.size = size
+
+    def _grow(self, capacity):
+        for column in ("last_watered", "water"):
+            array = getattr(self, column)
+            grown = np.zeros(capacity, array.dtype)
+            grown[:len(array)] = array
+            setattr(self, column, grown)
+
+    def _write(self, row, plant):
+        self.last_watered[row] = plant.last_watered
+        self.water[row] = plant.water
+
+    def add(self, plant):
+        if self.size == len(self.water):
+            self._grow(self.size * 2)
+        self._rows[plant.id] = self.size
+        self._plants.append(plant)
+        self._write(self.size, plant)
+        self.size += 1
+
+    def extend(self, plants):
+        plants = list(plants)
+        start, end = self.size, self.size + len(plants)
+        if end > len(self.water):
+            self._grow(max(end, self.size * 2))
+        self.last_watered[start:end] = np.fromiter((p.last_watered for p in plants), np.int32, len(plants))
+        self.water[start:end] = np.fromiter((p.water for p in plants), np.int32, len(plants))
+        for row, plant in enumerate(plants, start):
+            self._rows[plant.id] = row
+        self._plants.extend(plants)
+        self.size = end
+
+    def remove(self, plant):
+        row = self._rows.pop(plant.id)
+        self.size -= 1
+        last = self._plants.pop()
+        if last is not plant:
+            self._plants[row] = last
+            self._rows[last.id] = row
+            self._write(row, last)
+
+    def update(self, plant):
+        self._write(self._rows[plant.id], plant)
+
+    def _due(self):
+        return self.last_watered[:self.size] + self.water[:self.size]
+
+    def counts(self, today):
+        """(overdue, due today, healthy) counts against the ordinal today"""
+        overdue, due_today, healthy = np.bincount(np.sign(self._due() - today) + 1, minlength=3)
+        return int(overdue), int(due_today), int(healthy)
+
+    def histogram(self, start, days):
+        """Number of plants next due on each of the days from start (an ordinal)"""
+        offset = self._due() - start
+        offset = offset[(offset >= 0) & (offset < days)]
+        return np.bincount(offset, minlength=days).tolist()
+
+# ---------- SEARCH ----------
+SEARCH_GRAM = 3  # Names are indexed by their trigrams; shorter queries scan the names
+SEARCH_INDEX_BATCH = 500  # Bulk-added names trigram-indexed per index_pending() call (about 10 ms)
+DUE_STATUSES = ("overdue", "today", "healthy")
+
+def normalize_name(text):
+    """Case- and whitespace-insensitive form of a plant name or search text"""
+    return " ".join(text.casefold().split())
+
+def parse_query(query):
+    """Split search text such as "fern sun:low due:overdue" into (name text, sun, due)"""
+    words, sun, due = [], None, None
+    for token in query.split():
+        field, sep, value = token.partition(":")
+        field = field.casefold()
+        if sep and field == "sun" and value:
+            sun = value.casefold()
+        elif sep and field == "due" and value.casefold() in DUE_STATUSES:
+            due = value.casefold()
+        else:
+            words.append(token)
+    return normalize_name(" ".join(words)), sun, due
+
+class PlantSearchIndex:
+    """Trigram index over normalized plant names, plus sun and due-date lookups.
+
+    Plants are numbered in the order they were added, so results come back in
+    list order. The index is updated incrementally as plants are added, removed
+    or watered. Names added in bulk (loading, imports) are trigram-indexed
+    later, a batch per index_pending() call; until then queries scan only
+    those names, so no search ever waits for the whole table to be built. A
+    query that extends the previous one only rechecks the previous result
+    instead of going back to the index.
+    """
+
+    def __init__(self, plants=()):
+        self._seq = {}  # plant ID -> sequence number
+        self._plants = {}  # sequence number -> plant, in list order
+        self._names = {}  # sequence number -> normalized name
+        self._due = {}  # sequence number -> ordinal of the next due date
+        self._suns = {}  # sequence number -> sunlight level as indexed
+        self._grams = {}  # trigram -> set of sequence numbers, for every name not in _unindexed
+        self._unindexed = {}  # sequence number -> None, names added in bulk and not yet in _grams
+        self._sun = {}  # Sun level -> set of sequence numbers
+        self._next = 0
+        self._version = 0  # Bumped on every change so narrowing never reuses stale results
+        self._last = None  # (version, today, name, sun, due, result) of the previous search
+        self.extend(plants)
+
+    def __len__(self):
+        return len(self._plants)
+
+    @staticmethod
+    def _grams_of(name):
+        return {name[i:i + SEARCH_GRAM] for i in range(len(name) - SEARCH_GRAM + 1)}
+
+    def add(self, plant, defer=False):
+        """Index a plant; with defer its trigrams wait for index_pending()"""
+        seq = self._next
+        self._next += 1
+        self._seq[plant.id] = seq
+        self._plants[seq] = plant
+        if defer:
+            self._unindexed[seq] = None
+        self._index(seq, plant)
+
+    def extend(self, plants):
+        for plant in plants:
+            self.add(plant, defer=True)
+
+    def index_pending(self, limit=SEARCH_INDEX_BATCH):
+        """Trigram-index up to limit bulk-added names; True while more remain"""
+        unindexed, names, grams = self._unindexed, self._names, self._grams
+        for seq in list(itertools.islice(unindexed, limit)):
+            del unindexed[seq]
+            for gram in self._grams_of(names[seq]):
+                posting = grams.get(gram)
+                if posting is None:
+                    grams[gram] = {seq}
+                else:
+                    posting.add(seq)
+        return bool(unindexed)
+
+    def remove(self, plant):
+        seq = self._seq.pop(plant.id)
+        self._unindex(seq)
+        del self._plants[seq]
+
+    def update(self, plant):
+        """Re-index a plant after its name, sunlight or watering fields changed"""
+        seq = self._seq[plant.id]
+        self._unindex(seq)
+        self._index(seq, plant)
+
+    def _index(self, seq, plant):
+        name = normalize_name(plant.name)
+        self._names[seq] = name
+        self._due[seq] = plant.next_due
+        if seq not in self._unindexed:
+            for gram in self._grams_of(name):
+                self._grams.setdefault(gram, set()).add(seq)
+        self._suns[seq] = plant.sun
+        self._sun.setdefault(plant.sun, set()).add(seq)
+        self._version += 1
+
+    def _unindex(self, seq):
+        name = self._names.pop(seq)
+        if seq in self._unindexed:
+            del self._unindexed[seq]
+        else:
+            for gram in self._grams_of(name):
+                posting = self._grams[gram]
+                posting.discard(seq)
+                if not posting:
+                    del self._grams[gram]
+        self._sun[self._suns.pop(seq)].discard(seq)
+        del self._due[seq]
+        self._version += 1
+
+    def _name_matches(self, name):
+        """Sequence numbers whose name contains name, or None when name is empty"""
+        if not name:
+            return None
+        names = self._names
+        if len(name) < SEARCH_GRAM:
+            return {seq for seq, n in names.items() if name in n}
+        # Names not in the trigram table yet are checked one by one
+        scanned = {seq for seq in self._unindexed if name in names[seq]}
+        postings = sorted(
+            (self._grams.get(name[i:i + SEARCH_GRAM], set()) for i in range(len(name) - SEARCH_GRAM + 1)),
+            key=len
+        )
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                break
+        return {seq for seq in candidates if name in names[seq]} | scanned
+
+    def search(self, query, today=None):
+        """Return plants matching query in list order; see parse_query for the syntax"""
+        name, sun, due = parse_query(query)
+        today = (today or date.today()).toordinal()
+
+        last = self._last
+        if (last is not None and last[5] is not None and last[0] == self._version
+                and last[1] == today and last[3:5] == (sun, due) and last[2] in name):
+            # Extending the previous query can only narrow its result
+            names = self._names
+            result = {seq for seq in last[5] if name in names[seq]}
+        else:
+            result = self._name_matches(name)
+            if sun is not None:
+                try:
+                    posting = self._sun.get(Sun.parse(sun), set())
+                except ValueError:
+                    posting = set()  # Unknown level matches nothing
+                result = posting.copy() if result is None else result & posting
+            if due is not None:
+                result = self._filter_due(self._plants if result is None else result, due, today)
+
+        self._last = (self._version, today, name, sun, due, result)
+        if result is None:
+            return list(self._plants.values())
+        plants = self._plants
+        return [plants[seq] for seq in sorted(result)]
+
+    def _filter_due(self, seqs, due, today):
+        dues = self._due
+        if due == "overdue":
+            return {seq for seq in seqs if dues[seq] < today}
+        if due == "today":
+            return {seq for seq in seqs if dues[seq] == today}
+        return {seq for seq in seqs if dues[seq] > today}
+
+# ---------- PLANT COLLECTION ----------
+FORECAST_DAYS = 30  # Days covered by the upcoming-waterings forecast
+# One bisect per histogram day costs about as much as vectorizing this many plants,
+# so the columns only win for ranges longer than len(plants) / HISTOGRAM_BISECT_COST days
+HISTOGRAM_BISECT_COST = 256
+
+class PlantCollection:
+    """Ordered Plant records plus the search and due-date indexes kept in step with them.
+
+    Plants are keyed by ID in an insertion-ordered dict, so lookups and
+    deletes are O(1) while iteration keeps list order.
+    """
+
+    def __init__(self, plants=()):
+        self._plants = {}  # plant ID -> plant, in list order
+        self.version = 0  # Bumped on every change
+        self.saved_version = 0  # Version last written to disk
+        self._listeners = []
+        plants = self._claim(plants)
+        self.search_index = PlantSearchIndex(plants)
+        self.due_index = DueIndex(plants)
+        self.columns = PlantColumns(plants) if np is not None else None
+
+    @property
+    def dirty(self):
+        """True while there are changes that have not been written to disk"""
+        return self.version != self.saved_version
+
+    def subscribe(self, listener):
+        """Call listener(event, plants) after every change.
+
+        event is added, removed or updated, or loaded for plants read from
+        storage, which do not make the collection dirty.
+        """
+        self._listeners.append(listener)
+
+    def _changed(self, event, plants):
+        if event != "loaded":
+            self.version += 1
+        for listener in self._listeners:
+            listener(event, plants)
+
+    def __len__(self):
+        return len(self._plants)
+
+    def __iter__(self):
+        return iter(self._plants.values())
+
+    def __contains__(self, plant):
+        return self._plants.get(plant.id) is plant
+
+    def get(self, plant_id):
+        return self._plants.get(plant_id)
+
+    def _claim(self, plants):
+        """Take ownership of new plants, re-keying any whose ID is already in use"""
+        claimed = []
+        for plant in plants:
+            while plant.id in self._plants:
+                plant.id = new_plant_id()  # Duplicated by hand or by an old copy-paste
+                self.version += 1  # The new ID has to be saved
+            self._plants[plant.id] = plant
+            claimed.append(plant)
+        return claimed
+
+    @classmethod
+    def from_json(cls, records):
+        return cls(Plant.from_json(record) for record in records)
+
+    def to_json(self):
+        """Records in plants.json format; json.dump(..., indent=4) reproduces the file exactly"""
+        return [plant.to_json() for plant in self._plants.values()]
+
+    def add(self, plant):
+        self._claim([plant])
+        self.search_index.add(plant)
+        self.due_index.add(plant)
+        if self.columns is not None:
+            self.columns.add(plant)
+        self._changed("added", [plant])
+
+    def extend(self, plants, event="added"):
+        """Append many plants at once, bulk-updating the indexes"""
+        plants = self._claim(plants)
+        self.search_index.extend(plants)  # Trigrams follow through index_pending()
+        self.due_index.extend(plants)
+        if self.columns is not None:
+            self.columns.extend(plants)
+        self._changed(event, plants)
+
+    def _members(self, plants):
+        """plants without repeats; KeyError, before anything changes, if one is not in the collection"""
+        plants = list(dict.fromkeys(plants))
+        for plant in plants:
+            if plant not in self:
+                raise KeyError(f"{plant.name!r} is not in the collection")
+        return plants
+
+    def remove(self, *plants):
+        """Delete plants, sending one notification however many there are"""
+        plants = self._members(plants)
+        if not plants:
+            return
+        for plant in plants:
+            del self._plants[plant.id]
+            self.search_index.remove(plant)
+            if self.columns is not None:
+                self.columns.remove(plant)
+        self.due_index.remove(*plants)
+        self._changed("removed", plants)
+
+    def update(self, *plants, **fields):
+        """Set fields such as water=7 on every plant, re-indexing them and notifying once"""
+        plants = self._members(plants)
+        if not plants:
+            return
+        for plant in plants:
+            for field, value in fields.items():
+                setattr(plant, field, value)
+            if "sun" in fields and plant.extra:
+                plant.extra.pop("sun", None)  # An unrecognised label from the file no longer applies
+            self.search_index.update(plant)
+            if self.columns is not None:
+                self.columns.update(plant)
+        self.due_index.update(*plants)
+        self._changed("updated", plants)
+
+    def mark_watered(self, *plants, day=None):
+        """Record a watering on day (an ordinal, default today)"""
+        self.update(*plants, last_watered=date.today().toordinal() if day is None else day)
+
+    @TRACE.traced("search")
+    def search(self, query):
+        return self.search_index.search(query)
+
+    def due_counts(self, today=None, vectorized=False):
+        """(overdue, due today, healthy) counts against today (a date).
+
+        Two bisects of the due index; vectorized=True counts the NumPy
+        columns instead, which is O(n) and only useful as a cross-check.
+        """
+        today = today or date.today()
+        if vectorized and self.columns is not None:
+            return self.columns.counts(today.toordinal())
+        return self.due_index.counts(today)
+
+    def due_histogram(self, start=None, days=30, vectorized=None):
+        """Number of plants next due on each of the next `days` days, starting at start (a date).
+
+        By default the due index answers with one bisect per day and the NumPy
+        columns take over for ranges long enough that a single O(n) pass is
+        cheaper; vectorized=True or False forces one of them.
+        """
+        start = (start or date.today()).toordinal()
+        if vectorized is None:
+            vectorized = days * HISTOGRAM_BISECT_COST > len(self)
+        if vectorized and self.columns is not None:
+            return self.columns.histogram(start, days)
+        return self.due_index.histogram(start, days)
+
+    @TRACE.traced("summary")
+    def summary(self, today=None, days=FORECAST_DAYS):
+        """Dashboard numbers: total, overdue, today and healthy counts plus a days-long forecast"""
+        today = today or date.today()
+        overdue, due_today, healthy = self.due_counts(today)
+        return {"total": len(self), "today": due_today, "overdue": overdue, "healthy": healthy,
+                "forecast": self.due_histogram(today, days)}
+
+    def due_plants(self, after=None, today=None):
+        return self.due_index.due_plants(today, after)
+
+    def next_due_after(self, day):
+        return self.due_index.next_due_after(day)
+
+# ---------- STORAGE ----------
+PLANTS_FILE = "plants.json"
+PLANTS_DB = "plants.db"
+# "json" rewrites plants.json on save, "sqlite" commits every change to plants.db
+STORAGE_BACKEND = os.environ.get("PLANTPAL_STORAGE", "json")
+
+AUTOSAVE_DELAY = 1.0  # Seconds of quiet before a burst of changes is written
+
+def write_json_atomic(path, data, indent=None):
+    """Write data as JSON to a temp file beside path, then atomically replace path"""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        if indent is None:
+            json.dump(data, f, separators=(",", ":"))  # Compact: no whitespace at all
+        else:
+            json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)  # Readers see either the old file or the new one, never half
+
+# ---------- STREAMING LOAD ----------
+LOAD_CHUNK_SIZE = 2000  # Plants parsed per batch; the app's event loop runs between batches
+STREAM_READ_SIZE = 1 << 16
+INDEX_HEADER = struct.Struct("<4sQQQ")  # magic, plants.json size, plants.json mtime_ns, record count
+INDEX_MAGIC = b"PPI1"
+
+def index_path(path):
+    return path + ".idx"
+
+def iter_json_array(f, chunk_size):
+    """Yield lists of up to chunk_size elements of the JSON array in text file f, reading incrementally"""
+    decoder = json.JSONDecoder()
+    buf, pos, started = "", 0, False
+    batch = []
+    while True:
+        # Skip whitespace and separators, reading more text when the buffer runs out
+        while pos < len(buf) and buf[pos] in " \t\r\n,[":
+            started = started or buf[pos] == "["
+            pos += 1
+        if pos == len(buf):
+            more = f.read(STREAM_READ_SIZE)
+            if not more:
+                raise ValueError("Unexpected end of plant file")
+            buf, pos = more, 0
+            continue
+        if buf[pos] == "]" and started:
+            break
+        try:
+            record, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            more = f.read(STREAM_READ_SIZE)
+            if not more:
+                raise
+            buf, pos = buf[pos:] + more, 0  # Record straddles the read boundary
+            continue
+        batch.append(record)
+        pos = end
+        if len(batch) == chunk_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def write_plants_file(path, records):
+    """Atomically write records as compact JSON plus a sidecar index of each record's byte offset"""
+    offsets = array("Q")
+    parts = [b"["]
+    size = 1
+    for record in records:
+        if offsets:
+            parts.append(b",")
+            size += 1
+        data = json.dumps(record, separators=(",", ":")).encode()
+        offsets.append(size)
+        parts.append(data)
+        size += len(data)
+    parts.append(b"]")
+
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(b"".join(parts))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)  # Readers see either the old file or the new one, never half
+
+    st = os.stat(path)
+    tmp = f"{index_path(path)}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(INDEX_HEADER.pack(INDEX_MAGIC, st.st_size, st.st_mtime_ns, len(offsets)))
+        offsets.tofile(f)
+    os.replace(tmp, index_path(path))
+
+def read_index(path):
+    """Record offsets of path from its sidecar index, or None if missing or stale"""
+    try:
+        st = os.stat(path)
+        with open(index_path(path), "rb") as f:
+            magic, size, mtime_ns, count = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+            if (magic, size, mtime_ns) != (INDEX_MAGIC, st.st_size, st.st_mtime_ns):
+                return None
+            offsets = array("Q")
+            offsets.fromfile(f, count)
+            return offsets
+    except (OSError, EOFError, struct.error):
+        return None
+
+def iter_indexed_array(f, offsets, chunk_size):
+    """Yield lists of up to chunk_size records of binary file f, reading each batch's exact bytes via offsets.
+
+    A batch is one seek, one read and one json.loads over just its records,
+    instead of decoding record by record from a text buffer.
+    """
+    end_of_array = f.seek(0, os.SEEK_END) - 1  # Position of the closing bracket
+    for start in range(0, len(offsets), chunk_size):
+        stop = start + chunk_size
+        end = offsets[stop] - 1 if stop < len(offsets) else end_of_array  # Drop the separating comma
+        f.seek(offsets[start])
+        yield json.loads(b"[" + f.read(end - offsets[start]) + b"]")
+
+class JsonStorage:
+    """plants.json, written by a background thread shortly after every change.
+
+    Changes only mark the collection dirty and push back the write deadline,
+    so a burst of edits becomes one write and the Tk thread never waits on disk.
+    Each change also snapshots the plant list on the changing thread, so the
+    writer never iterates the collection while it is being edited. A load
+    that fails partway leaves the storage failed: nothing is written again,
+    so the plants after the bad record stay in plants.json.
+    """
+
+    def __init__(self, path=PLANTS_FILE, delay=AUTOSAVE_DELAY):
+        self.path = path
+        self.delay = delay
+        self.plants = None
+        self.error = None  # Last write failure, cleared by the next successful write
+        self._cond = threading.Condition()
+        self._deadline = None  # time.monotonic() at which the pending write starts
+        self._pending = None  # (version, plants) snapshot the pending write serializes
+        self._writing = False  # The writer thread is serializing a snapshot right now
+        self._closing = False
+        self._thread = None
+        self.loading = False  # Set until iter_chunks finishes; a half-loaded collection is never written
+        self.failed = None  # Why loading stopped partway; while set nothing is written
+
+    def load(self):
+        plants = PlantCollection()
+        for chunk in self.iter_chunks():
+            plants.extend(chunk, "loaded")
+        return plants
+
+    def count(self):
+        """Number of stored plants if known without parsing, else None"""
+        offsets = read_index(self.path)
+        return len(offsets) if offsets is not None else None
+
+    def iter_chunks(self, chunk_size=LOAD_CHUNK_SIZE):
+        """Yield lists of Plants as plants.json is parsed incrementally, batch by batch through its index if current"""
+        if not os.path.exists(self.path):
+            return
+        self.loading = True
+        missing_ids = False
+        offsets = read_index(self.path)
+        try:
+            with open(self.path, "r" if offsets is None else "rb") as f:
+                # A current index means the file is exactly as written; otherwise stream it
+                if offsets is None:
+                    batches = iter_json_array(f, chunk_size)
+                else:
+                    batches = iter_indexed_array(f, offsets, chunk_size)
+                for records in batches:
+                    missing_ids = missing_ids or any("id" not in record for record in records)
+                    yield [Plant.from_json(record) for record in records]
+        except Exception as e:
+            self.failed = e  # The collection is missing every plant after this point
+            raise
+        # Only here: a loader abandoned partway (closing early) leaves loading set, so the
+        # unread plants are never overwritten
+        self.loading = False
+        if self.plants is not None and (self.plants.dirty or missing_ids):
+            self.schedule()  # Edits made while loading, or IDs given to plants from an older file
+
+    def attach(self, plants):
+        """Autosave plants whenever they change"""
+        self.plants = plants
+        plants.subscribe(lambda event, changed: event != "loaded" and self.schedule())
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def schedule(self, delay=None):
+        """Write once changes have paused for delay seconds (default: self.delay)"""
+        snapshot = self._snapshot()
+        with self._cond:
+            self._pending = snapshot
+            self._deadline = time.monotonic() + (self.delay if delay is None else delay)
+            self._cond.notify()
+
+    def save(self, plants):
+        self.schedule(0)  # Still written by the background thread
+
+    @property
+    def saving(self):
+        """True while a write is scheduled or running; error holds its outcome once false"""
+        return self._deadline is not None or self._writing
+
+    def export(self, path):
+        """Write a pretty-printed copy of the collection to path"""
+        write_json_atomic(path, self.plants.to_json(), indent=4)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._deadline is None and not self._closing:
+                    self._cond.wait()
+                # Every new change moves the deadline, coalescing the burst
+                while not self._closing and self._deadline > time.monotonic():
+                    self._cond.wait(self._deadline - time.monotonic())
+                if self._closing:
+                    return
+                self._writing = True  # Set before the deadline clears, so saving never flickers false
+                self._deadline = None
+                snapshot, self._pending = self._pending, None
+            try:
+                self._write(snapshot)
+            except Exception as e:  # Keep autosaving; the next change retries
+                self.error = e
+            finally:
+                self._writing = False
+
+    def _snapshot(self):
+        """The collection's version and plants as of now (a list copy, cheap next to a write)"""
+        return self.plants.version, list(self.plants)
+
+    @TRACE.traced("storage.write")
+    def _write(self, snapshot=None):
+        if self.loading or self.failed is not None:
+            return  # Half-loaded; writing would drop every plant that was not read
+        # A change made after the snapshot leaves the collection dirty and has
+        # already scheduled another write
+        version, plants = snapshot or self._snapshot()
+        try:
+            write_plants_file(self.path, (plant.to_json() for plant in plants))
+        except OSError as e:
+            self.error = e
+            return
+        self.error = None
+        self.plants.saved_version = max(self.plants.saved_version, version)
+
+    def close(self):
+        """Stop the writer and flush unsaved changes (called when the window closes)"""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join()
+        if self.plants is not None and (self.plants.dirty or self._deadline is not None):
+            self._write()  # A no-op after a failed load
+
+class SqliteStorage:
+    """plants.db with one row per plant; every change is its own small transaction.
+
+    Rows are keyed by plant ID and indexed by normalized name and next due
+    date, so searches and statistics can be answered by the database without
+    loading every plant (plant_cli.py does this). An existing plants.json is
+    imported the first time the database is opened.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS plants (
+            id INTEGER PRIMARY KEY,
+            uid TEXT,
+            name TEXT NOT NULL,
+            name_key TEXT NOT NULL,
+            water INTEGER NOT NULL,
+            sun INTEGER NOT NULL,
+            image TEXT NOT NULL,
+            last_watered INTEGER NOT NULL,
+            next_due INTEGER NOT NULL,
+            extra TEXT
+        );
+        CREATE INDEX IF NOT EXISTS plants_name ON plants (name_key);
+        CREATE INDEX IF NOT EXISTS plants_due ON plants (next_due);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    def __init__(self, path=PLANTS_DB, import_from=PLANTS_FILE):
+        self.path = path
+        self.import_from = import_from
+        self.db = sqlite3.connect(path)
+        self.plants = None
+        self.error = None
+        self.saving = False  # Changes are committed as they happen, never in the background
+        self.failed = None  # Why loading stopped partway; while set changes are not committed
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")  # Durable across app crashes, fast commits
+        self.db.executescript(self.SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Give databases created before plant IDs a uid column, filled in once"""
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(plants)")}
+        with self.db:
+            if "uid" not in columns:
+                self.db.execute("ALTER TABLE plants ADD COLUMN uid TEXT")
+            rowids = [rowid for rowid, in self.db.execute("SELECT id FROM plants WHERE uid IS NULL")]
+            self.db.executemany("UPDATE plants SET uid = ? WHERE id = ?",
+                                ((new_plant_id(), rowid) for rowid in rowids))
+            self.db.execute("CREATE UNIQUE INDEX IF NOT EXISTS plants_uid ON plants (uid)")
+
+    PLANT_COLUMNS = "uid, name, water, sun, image, last_watered, extra"
+
+    @staticmethod
+    def _plant(row):
+        """Plant for a row of PLANT_COLUMNS"""
+        uid, name, water, sun, image, last_watered, extra = row
+        return Plant(name, water, Sun(sun), image, last_watered, json.loads(extra) if extra else None, uid)
+
+    @staticmethod
+    def _row(plant):
+        extra = json.dumps(plant.extra) if plant.extra else None
+        return (plant.name, normalize_name(plant.name), plant.water, int(plant.sun),
+                plant.image, plant.last_watered, plant.next_due, extra, plant.id)
+
+    def load(self):
+        plants = PlantCollection()
+        for chunk in self.iter_chunks():
+            plants.extend(chunk, "loaded")
+        return plants
+
+    def count(self):
+        self._ensure_imported()  # On a first run the plants are still in plants.json
+        return self.db.execute("SELECT COUNT(*) FROM plants").fetchone()[0]
+
+    def iter_chunks(self, chunk_size=LOAD_CHUNK_SIZE):
+        """Yield lists of Plants read from the database in id order.
+
+        Only rows that existed when loading started are read, a page at a
+        time: plants added between batches are already in the collection.
+        """
+        try:
+            self._ensure_imported()
+            last, = self.db.execute("SELECT COALESCE(MAX(id), 0) FROM plants").fetchone()
+            after = 0
+            while True:
+                rows = self.db.execute(
+                    f"SELECT id, {self.PLANT_COLUMNS} FROM plants"
+                    " WHERE id > ? AND id <= ? ORDER BY id LIMIT ?", (after, last, chunk_size)
+                ).fetchall()
+                if not rows:
+                    return
+                after = rows[-1][0]
+                yield [self._plant(row[1:]) for row in rows]
+        except Exception as e:
+            self.failed = e
+            raise
+
+    def _ensure_imported(self):
+        if self.db.execute("SELECT value FROM meta WHERE key = 'imported'").fetchone() is None:
+            self._import_json()
+
+    def _import_json(self):
+        """Copy plants.json into the database once, in a single transaction"""
+        records = []
+        if self.import_from and os.path.exists(self.import_from):
+            with open(self.import_from, "r") as f:
+                records = json.load(f)
+        with self.db:
+            self.db.executemany(
+                "INSERT OR IGNORE INTO plants (name, name_key, water, sun, image, last_watered, next_due, extra, uid)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._row(Plant.from_json(record)) for record in records)
+            )
+            self.db.execute("INSERT INTO meta (key, value) VALUES ('imported', ?)", (self.import_from or "",))
+
+    def attach(self, plants):
+        """Commit every change notification of plants as it happens"""
+        self.plants = plants
+        plants.subscribe(self._on_change)
+
+    INSERT = ("INSERT INTO plants (name, name_key, water, sun, image, last_watered, next_due, extra, uid)"
+              " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)")
+
+    def insert(self, plants):
+        """Add plants in one transaction without loading the stored ones, re-keying any whose ID is taken"""
+        self._ensure_imported()
+        plants = list(plants)
+        ids = [plant.id for plant in plants]
+        taken = set()
+        for start in range(0, len(ids), 500):  # Stays under SQLite's limit on query parameters
+            batch = ids[start:start + 500]
+            taken.update(uid for uid, in self.db.execute(
+                f"SELECT uid FROM plants WHERE uid IN ({','.join('?' * len(batch))})", batch))
+        for plant in plants:
+            while plant.id in taken:
+                plant.id = new_plant_id()  # Duplicated by hand or by an old copy-paste
+            taken.add(plant.id)
+        with TRACE.span("storage.write"), self.db:
+            self.db.executemany(self.INSERT, map(self._row, plants))
+
+    def _on_change(self, event, plants):
+        if event == "loaded" or self.failed is not None:
+            return
+        with TRACE.span("storage.write"), self.db:  # One transaction per notification, however many plants it covers
+            if event == "added":
+                self.db.executemany(self.INSERT, map(self._row, plants))
+            elif event == "removed":
+                self.db.executemany("DELETE FROM plants WHERE uid = ?", ((plant.id,) for plant in plants))
+            else:
+                self.db.executemany(
+                    "UPDATE plants SET name = ?, name_key = ?, water = ?, sun = ?, image = ?,"
+                    " last_watered = ?, next_due = ?, extra = ? WHERE uid = ?",
+                    map(self._row, plants)
+                )
+        self.plants.saved_version = self.plants.version
+
+    def save(self, plants):
+        pass  # Every change is already committed
+
+    def export(self, path):
+        """Write a pretty-printed plants.json copy of the database to path"""
+        write_json_atomic(path, self.plants.to_json(), indent=4)
+
+    def search(self, query, today=None):
+        """Plants matching query (see parse_query), read straight from the matching rows"""
+        self._ensure_imported()
+        name, sun, due = parse_query(query)
+        today = (today or date.today()).toordinal()
+        clauses, args = [], []
+        if name:
+            escaped = name.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            clauses.append("name_key LIKE ? ESCAPE '\\'")
+            args.append(f"%{escaped}%")
+        if sun is not None:
+            try:
+                clauses.append("sun = ?")
+                args.append(int(Sun.parse(sun)))
+            except ValueError:
+                return []
+        if due is not None:
+            clauses.append({"overdue": "next_due < ?", "today": "next_due = ?", "healthy": "next_due > ?"}[due])
+            args.append(today)
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        rows = self.db.execute(f"SELECT {self.PLANT_COLUMNS} FROM plants{where} ORDER BY id", args)
+        return [self._plant(row) for row in rows]
+
+    def due_counts(self, today=None):
+        """(overdue, due today, healthy) counts, answered from the next_due index"""
+        today = (today or date.today()).toordinal()
+        count = lambda sql: self.db.execute(f"SELECT COUNT(*) FROM plants WHERE {sql}", (today,)).fetchone()[0]
+        return count("next_due < ?"), count("next_due = ?"), count("next_due > ?")
+
+    def summary(self, today=None, days=FORECAST_DAYS):
+        """The numbers of PlantCollection.summary, counted by the database"""
+        self._ensure_imported()
+        today = today or date.today()
+        overdue, due_today, healthy = self.due_counts(today)
+        start = today.toordinal()
+        forecast = [0] * days
+        rows = self.db.execute("SELECT next_due, COUNT(*) FROM plants WHERE next_due >= ? AND next_due < ?"
+                               " GROUP BY next_due", (start, start + days))
+        for due, count in rows:
+            forecast[due - start] = count
+        return {"total": overdue + due_today + healthy, "today": due_today, "overdue": overdue,
+                "healthy": healthy, "forecast": forecast}
+
+    def close(self):
+        self.db.close()
+
+def open_storage(backend=None):
+    """Storage for the configured backend ("json" or "sqlite")"""
+    backend = backend or STORAGE_BACKEND
+    if backend == "sqlite":
+        return SqliteStorage()
+    if backend == "json":
+        return JsonStorage()
+    raise ValueError(f"Unknown storage backend: {backend!r}")
+
+# ---------- WATERING HISTORY ----------
+HISTORY_DIR = "history"
+HISTORY_SEGMENT_BYTES = 256 * 1024  # The active log segment is sealed once it grows past this
+
+class WateringStats:
+    """Running aggregates of one plant's watering history"""
+    __slots__ = ("count", "interval_total", "late", "streak", "best_streak", "last")
+
+    def __init__(self, count=0, interval_total=0, late=0, streak=0, best_streak=0, last=None):
+        self.count = count  # Waterings logged
+        self.interval_total = interval_total  # Sum of days since the previous watering
+        self.late = late  # Waterings that came after the plant was already due
+        self.streak = streak  # Consecutive on-time waterings up to the latest one
+        self.best_streak = best_streak
+        self.last = last  # Ordinal of the latest watering
+
+    @property
+    def average_interval(self):
+        return self.interval_total / self.count if self.count else None
+
+    def add(self, day, previous, interval):
+        self.count += 1
+        self.interval_total += day - previous
+        if day - previous > interval:
+            self.late += 1
+            self.streak = 0
+        else:
+            self.streak += 1
+            self.best_streak = max(self.best_streak, self.streak)
+        self.last = day
+
+    def to_json(self):
+        return [self.count, self.interval_total, self.late, self.streak, self.best_streak, self.last]
+
+class WateringLog:
+    """Append-only log of watering events, with per-plant aggregates kept up to date.
+
+    Each event is one short line in the active segment file. A segment that
+    grows past segment_bytes is sealed; its events are folded into a snapshot
+    of the aggregates and the sealed segment is deleted, so the log stays small
+    no matter how many years of events it has seen. Deleting a plant logs a
+    forget line and drops its aggregates, so the snapshot only ever holds
+    plants that still exist.
+    """
+
+    def __init__(self, directory=HISTORY_DIR, segment_bytes=HISTORY_SEGMENT_BYTES):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.snapshot_path = os.path.join(directory, "snapshot.json")
+        self.stats = {}  # plant key -> WateringStats
+        self.segment = 1  # Number of the active segment
+        self._file = None
+
+        folded = 0  # Segments up to this one are already in the snapshot
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r") as f:
+                snapshot = json.load(f)
+            folded = snapshot["through"]
+            self.stats = {key: WateringStats(*values) for key, values in snapshot["stats"].items()}
+        self.segment = folded + 1
+        for number in self._segments():
+            if number > folded:
+                self._replay(number)
+                self.segment = number
+
+    def _segment_path(self, number):
+        return os.path.join(self.directory, f"{number:08d}.log")
+
+    def _segments(self):
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(int(name[:-4]) for name in os.listdir(self.directory)
+                      if name.endswith(".log") and name[:-4].isdigit())
+
+    def _replay(self, number):
+        with open(self._segment_path(number), "r") as f:
+            for line in f:
+                try:
+                    if line.startswith("forget "):
+                        self.stats.pop(json.loads(line[7:]), None)
+                        continue
+                    day, previous, interval, key = line.split(" ", 3)
+                    self._apply(json.loads(key), int(day), int(previous), int(interval))
+                except ValueError:
+                    continue  # Torn last line from a crash
+
+    def _apply(self, key, day, previous, interval):
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = WateringStats()
+        stats.add(day, previous, interval)
+
+    def record_many(self, events):
+        """Log (key, day, previous, interval) events with a single write"""
+        lines = []
+        for key, day, previous, interval in events:
+            self._apply(key, day, previous, interval)
+            lines.append(f"{day} {previous} {interval} {json.dumps(key)}\n")
+        self._append(lines)
+
+    def forget(self, keys):
+        """Drop the history of deleted plants, logged so that replaying the segment drops it too"""
+        lines = []
+        for key in keys:
+            if self.stats.pop(key, None) is not None:
+                lines.append(f"forget {json.dumps(key)}\n")
+        self._append(lines)
+
+    def follow(self, plants):
+        """Forget plants as they are removed from the collection plants"""
+        plants.subscribe(lambda event, changed: event == "removed" and self.forget(p.id for p in changed))
+
+    def _append(self, lines):
+        if not lines:
+            return
+        if self._file is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self._file = open(self._segment_path(self.segment), "a")
+        self._file.write("".join(lines))
+        self._file.flush()
+        if self._file.tell() >= self.segment_bytes:
+            self.compact()
+
+    def stats_for(self, key):
+        return self.stats.get(key)
+
+    def compact(self):
+        """Seal the active segment, fold everything into the snapshot and delete old segments"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        os.makedirs(self.directory, exist_ok=True)
+        write_json_atomic(self.snapshot_path, {
+            "through": self.segment,
+            "stats": {key: stats.to_json() for key, stats in self.stats.items()}
+        })
+        for number in self._segments():
+            if number <= self.segment:
+                os.remove(self._segment_path(number))
+        self.segment += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def record_watering(plants, history, targets, day=None):
+    """Mark targets watered on day (default today) as one change, logging each watering"""
+    previous = [plant.last_watered for plant in targets]
+    plants.mark_watered(*targets, day=day)
+    history.record_many((plant.id, plant.last_watered, last, plant.water)
+                        for plant, last in zip(targets, previous))
+
+# ---------- BULK IMPORT ----------
+def read_csv_plants(f, chunk_size=LOAD_CHUNK_SIZE):
+    """Yield lists of Plants from CSV text whose header names at least name and water.
+
+    Optional columns are sun (default Medium), image, last_watered (ISO date,
+    default today) and id. Errors name the offending line.
+    """
+    reader = csv.reader(f)
+    header = [column.strip().casefold() for column in next(reader, [])]
+    missing = {"name", "water"}.difference(header)
+    if missing:
+        raise ValueError(f"CSV header has no {' or '.join(sorted(missing))} column")
+    column = {name: i for i, name in enumerate(header)}
+    name_at, water_at = column["name"], column["water"]
+    sun_at, image_at = column.get("sun"), column.get("image")
+    watered_at, id_at = column.get("last_watered"), column.get("id")
+
+    today = date.today().toordinal()
+    suns = {"": Sun.MEDIUM}  # Text as written -> Sun, so each spelling is parsed once
+    days = {"": today}  # Date text -> ordinal, most rows share a handful of dates
+    chunk = []
+    for line, row in enumerate(reader, 2):
+        if not row:
+            continue
+        try:
+            sun_text = row[sun_at] if sun_at is not None else ""
+            sun = suns.get(sun_text)
+            if sun is None:
+                sun = suns[sun_text] = Sun.parse(sun_text)
+            day_text = row[watered_at].strip() if watered_at is not None else ""
+            day = days.get(day_text)
+            if day is None:
+                day = days[day_text] = date.fromisoformat(day_text).toordinal()
+            name = row[name_at].strip()
+            if not name:
+                raise ValueError("empty name")
+            chunk.append(Plant(
+                name, int(row[water_at]), sun, row[image_at] if image_at is not None else "", day,
+                None, row[id_at] if id_at is not None else None
+            ))
+        except (ValueError, IndexError) as e:
+            raise ValueError(f"line {line}: {e}") from None
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def read_json_plants(f, chunk_size=LOAD_CHUNK_SIZE):
+    """Yield lists of Plants from a JSON array of plants.json records"""
+    count = 0
+    for records in iter_json_array(f, chunk_size):
+        chunk = []
+        for record in records:
+            count += 1
+            try:
+                chunk.append(Plant.from_json(record))
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"record {count}: {e!r}") from None
+        yield chunk
+
+# ---------- SCHEDULE EXPORT ----------
+def iter_schedule(plants, start, days):
+    """Yield (day ordinal, plant, days overdue) waterings from start for days days, in date order.
+
+    Overdue plants are scheduled on start. Only plants due before the end are
+    touched, and each watering is yielded as soon as it is known, so a
+    schedule can be written while it is being computed.
+    """
+    end = start + days
+    # Already in date order, so the list is a valid heap as it stands
+    heap = [(max(plant.next_due, start), n, plant)
+            for n, plant in enumerate(plants.due_plants(today=date.fromordinal(end - 1)))]
+    n = len(heap)
+    while heap:
+        day, _, plant = heap[0]
+        overdue = max(0, start - plant.next_due) if day == start else 0
+        yield day, plant, overdue
+        step = max(plant.water, 1)  # An interval of 0 means every day, not forever today
+        if day + step < end:
+            n += 1
+            heapq.heapreplace(heap, (day + step, n, plant))
+        else:
+            heapq.heappop(heap)
+
+def write_schedule_csv(f, plants, start, days):
+    """Write the schedule as CSV, one row per watering; returns the number of rows"""
+    writer = csv.writer(f)
+    writer.writerow(("date", "id", "name", "water", "sun", "days_overdue"))
+    rows = 0
+    for day, plant, overdue in iter_schedule(plants, start, days):
+        writer.writerow((date.fromordinal(day).isoformat(), plant.id, plant.name, plant.water,
+                         plant.sun.label, overdue))
+        rows += 1
+    return rows
+
+def _ics_text(text):
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+def _ics_line(line):
+    """Fold a content line to 75 octets as RFC 5545 requires"""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line + "\r\n"
+    parts, limit = [], 75
+    while data:
+        cut = min(limit, len(data))
+        while cut < len(data) and (data[cut] & 0xC0) == 0x80:
+            cut -= 1  # Never split a UTF-8 sequence
+        parts.append(data[:cut].decode("utf-8"))
+        data, limit = data[cut:], 74  # Continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+def write_schedule_ics(f, plants, start, days):
+    """Write the schedule as iCalendar, one repeating all-day event per plant; returns the event count"""
+    end = start + days
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    until = date.fromordinal(end - 1).strftime("%Y%m%d")
+    f.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//My Plant Pal//Watering Schedule//EN\r\n")
+    events = 0
+    for plant in plants.due_plants(today=date.fromordinal(end - 1)):
+        first = date.fromordinal(max(plant.next_due, start)).strftime("%Y%m%d")
+        f.write("BEGIN:VEVENT\r\n")
+        f.write(_ics_line(f"UID:{plant.id}@my-plant-pal"))
+        f.write(f"DTSTAMP:{stamp}\r\n")
+        f.write(f"DTSTART;VALUE=DATE:{first}\r\n")
+        f.write(f"RRULE:FREQ=DAILY;INTERVAL={max(plant.water, 1)};UNTIL={until}\r\n")
+        f.write(_ics_line(f"SUMMARY:{_ics_text('Water ' + plant.name)}"))
+        f.write("END:VEVENT\r\n")
+        events += 1
+    f.write("END:VCALENDAR\r\n")
+    return events
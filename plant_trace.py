@@ -0,0 +1,146 @@
+"""
+My Plant Pal tracing - timing spans and counters for the hot paths, off unless asked for.
+
+    @TRACE.traced("filter_plants")
+    def filter_plants(self): ...
+
+    with TRACE.span("thumb.generate"):
+        ...
+
+While TRACE.enabled is false a traced call costs one attribute check; once
+enabled, every span is kept in a rolling window for percentiles and in a
+bounded event buffer that dump() writes as a Chrome trace (open it in
+chrome://tracing or ui.perfetto.dev).
+|================================================================================|
+Author: Victor Delgado | GitHub: https://github.com/VictorDelgadoJ-Ops/My-Plant-Pal
+"""
+
+import functools, json, os, threading, time
+from collections import Counter, deque
+
+TRACE_WINDOW = 1000  # Latest durations per span name kept for the rolling percentiles
+TRACE_EVENTS_MAX = 200_000  # Spans kept for dump(); the oldest are dropped first
+
+class _NullSpan:
+    """What span() hands out while tracing is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+NULL_SPAN = _NullSpan()
+
+class _Span:
+    __slots__ = ("tracer", "name", "started")
+
+    def __init__(self, tracer, name):
+        self.tracer = tracer
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.record(self.name, self.started, time.perf_counter())
+        return False
+
+class Tracer:
+    """Spans and counters from any thread, recorded only while enabled.
+
+    Durations go into a per-name rolling window (for p50/p99) and, with their
+    start time and thread, into an event buffer for offline profiling.
+    """
+
+    def __init__(self, window=TRACE_WINDOW, max_events=TRACE_EVENTS_MAX):
+        self.enabled = False
+        self.window = window
+        self.epoch = time.perf_counter()  # Trace timestamps count from here
+        self.durations = {}  # span name -> deque of recent durations in ms
+        self.counters = Counter()
+        self.events = deque(maxlen=max_events)  # (name, start, end, thread ID)
+        self._lock = threading.Lock()
+
+    def span(self, name):
+        """Context manager timing its block as name"""
+        return _Span(self, name) if self.enabled else NULL_SPAN
+
+    def traced(self, name=None):
+        """Decorator timing every call of the function (as name, default its qualified name)"""
+        def decorate(func):
+            label = name or func.__qualname__
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                started = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(label, started, time.perf_counter())
+            return wrapper
+        return decorate
+
+    def record(self, name, started, ended):
+        """Add a span that ran from started to ended (perf_counter seconds)"""
+        with self._lock:
+            window = self.durations.get(name)
+            if window is None:
+                window = self.durations[name] = deque(maxlen=self.window)
+            window.append((ended - started) * 1000)
+            self.events.append((name, started, ended, threading.get_ident()))
+
+    def count(self, name, n=1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += n
+
+    def totals(self):
+        """Copy of the counters"""
+        with self._lock:
+            return dict(self.counters)
+
+    def percentiles(self):
+        """{span name: (calls in window, p50 ms, p99 ms, max ms)} over each rolling window"""
+        with self._lock:
+            windows = {name: sorted(window) for name, window in self.durations.items()}
+        result = {}
+        for name, ordered in windows.items():
+            if ordered:
+                n = len(ordered)
+                result[name] = (n, ordered[n // 2], ordered[min(n - 1, n * 99 // 100)], ordered[-1])
+        return result
+
+    def reset(self):
+        with self._lock:
+            self.durations.clear()
+            self.counters.clear()
+            self.events.clear()
+
+    def dump(self, path):
+        """Write the buffered spans and counters to path in Chrome trace event format"""
+        with self._lock:
+            events = list(self.events)
+        counters = self.totals()
+        pid = os.getpid()
+        trace = {
+            "traceEvents": [
+                {"name": name, "ph": "X", "pid": pid, "tid": tid,
+                 "ts": round((started - self.epoch) * 1e6, 1), "dur": round((ended - started) * 1e6, 1)}
+                for name, started, ended, tid in events
+            ],
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": counters}
+        }
+        tmp = f"{path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(trace, f, separators=(",", ":"))
+        os.replace(tmp, path)
+        return len(events)
+
+# Shared by plant_core and the app
+TRACE = Tracer()
@@ -0,0 +1,60 @@
+"""
+Checks that the NumPy columns and the pure-Python due index agree on every statistic.
+
+    python -m unittest test_plant_core    (or: python -m pytest)
+|================================================================================|
+Author: Victor Delgado | GitHub: https://github.com/VictorDelgadoJ-Ops/My-Plant-Pal
+"""
+
+import random, unittest
+from datetime import date, timedelta
+from plant_core import Plant, PlantCollection, Sun, np
+
+TODAY = date(2026, 1, 1)
+
+def brute_force_counts(plants, today):
+    """(overdue, due today, healthy) by looking at every plant"""
+    day = today.toordinal()
+    dues = [plant.next_due for plant in plants]
+    return (sum(due < day for due in dues), sum(due == day for due in dues), sum(due > day for due in dues))
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class StatisticsAgreeTest(unittest.TestCase):
+    def assert_agree(self, plants):
+        for today in (TODAY, TODAY - timedelta(days=12), TODAY + timedelta(days=9)):
+            expected = brute_force_counts(plants, today)
+            self.assertEqual(plants.due_counts(today, vectorized=False), expected)
+            self.assertEqual(plants.due_counts(today, vectorized=True), expected)
+        for start, days in ((TODAY, 30), (TODAY - timedelta(days=40), 90), (TODAY, 1)):
+            self.assertEqual(plants.due_histogram(start, days, vectorized=True),
+                             plants.due_histogram(start, days, vectorized=False))
+        self.assertEqual(plants.summary(TODAY)["forecast"], plants.due_histogram(TODAY, 30, vectorized=True))
+
+    def test_interleaved_changes(self):
+        rng = random.Random(9)
+        base = TODAY.toordinal()
+
+        def new_plant(n):
+            return Plant(f"Plant {n}", rng.randint(1, 21), rng.choice(list(Sun)),
+                         last_watered=base - rng.randint(0, 40))
+
+        plants = PlantCollection(new_plant(n) for n in range(500))
+        self.assert_agree(plants)
+        for step in range(400):
+            live = list(plants)
+            action = rng.random()
+            if action < 0.25:
+                plants.add(new_plant(1000 + step))
+            elif action < 0.35:
+                plants.extend([new_plant(5000 + step * 100 + n) for n in range(rng.randint(1, 80))])
+            elif action < 0.55 and live:
+                plants.remove(*rng.sample(live, min(len(live), rng.randint(1, 3))))
+            elif action < 0.8 and live:
+                plants.mark_watered(*rng.sample(live, min(len(live), rng.randint(1, 70))),
+                                    day=base - rng.randint(0, 10))
+            elif live:
+                plants.update(*rng.sample(live, min(len(live), rng.randint(1, 5))), water=rng.randint(1, 21))
+            self.assert_agree(plants)
+
+if __name__ == "__main__":
+    unittest.main()